@@ -1,6 +1,10 @@
 -- Create ANPR service tables manually
 -- This is needed because auth-service and anpr-service share the same database
 
+-- The ngram FULLTEXT index on lpr_events.plate_number must be built without
+-- InnoDB's default stopwords (single letters would drop most plate tokens).
+SET SESSION innodb_ft_enable_stopword = OFF;
+
 CREATE TABLE IF NOT EXISTS anpr_cameras (
     id INT AUTO_INCREMENT PRIMARY KEY,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
@@ -16,7 +20,6 @@ CREATE TABLE IF NOT EXISTS anpr_cameras (
     gateway VARCHAR(45),
     device_name VARCHAR(255),
     device_location VARCHAR(255),
-    INDEX idx_anpr_cameras_id (id),
     INDEX idx_anpr_cameras_mac (mac),
     INDEX idx_anpr_cameras_ipaddress (ipaddress)
 );
@@ -47,14 +50,18 @@ CREATE TABLE IF NOT EXISTS lpr_events (
     plate_roi_y INT,
     plate_roi_width INT,
     plate_roi_height INT,
+    matched_list VARCHAR(64),
+    violation_type VARCHAR(64),
     FOREIGN KEY (camera_id) REFERENCES anpr_cameras(id) ON DELETE SET NULL,
-    INDEX idx_lpr_events_id (id),
-    INDEX idx_lpr_events_camera_id (camera_id),
+    INDEX idx_lpr_events_camera_time (camera_id, event_time),
     INDEX idx_lpr_events_device_ip (device_ip),
-    INDEX idx_lpr_events_event_time (event_time),
-    INDEX idx_lpr_events_event_type (event_type),
+    INDEX idx_lpr_events_event_time_desc (event_time DESC, id DESC),
+    INDEX idx_lpr_events_type_time (event_type, event_time),
+    INDEX idx_lpr_events_matched_list_time (matched_list, event_time),
+    INDEX idx_lpr_events_violation_type_time (violation_type, event_time),
     INDEX idx_lpr_events_event_uid (event_uid),
-    INDEX idx_lpr_events_plate_number (plate_number)
+    INDEX idx_lpr_events_plate_number (plate_number),
+    FULLTEXT INDEX ft_lpr_events_plate_number (plate_number) WITH PARSER ngram
 );
 
 CREATE TABLE IF NOT EXISTS list_events (
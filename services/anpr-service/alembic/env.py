@@ -2,8 +2,6 @@
 Alembic environment configuration for ANPR service
 """
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config
-from sqlalchemy import pool
 from alembic import context
 import os
 import sys
@@ -21,7 +19,7 @@ sys.path.insert(0, root_dir)
 sys.path.insert(0, anpr_service_dir)
 
 from services.shared.database.base import Base
-from services.shared.database.session import DATABASE_URL
+from services.shared.database.session import DATABASE_URL, engine
 
 # Import ANPR service models to register metadata
 from app import models  # noqa: F401
@@ -53,11 +51,9 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    # Reuse the service's pooled engine (same DATABASE_URL) rather than
+    # opening an unpooled connection for every migration run.
+    connectable = engine
 
     with connectable.connect() as connection:
         context.configure(
@@ -26,8 +26,8 @@ def upgrade() -> None:
         sa.Column("mac", sa.String(length=32), nullable=False),
         sa.Column("firmware_version", sa.String(length=128), nullable=True),
         sa.Column("system_boot_time", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("wireless", sa.Boolean(), server_default=sa.text("0"), nullable=False),
-        sa.Column("dhcp_enable", sa.Boolean(), server_default=sa.text("1"), nullable=False),
+        sa.Column("wireless", sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column("dhcp_enable", sa.Boolean(), server_default=sa.true(), nullable=False),
         sa.Column("ipaddress", sa.String(length=45), nullable=True),
         sa.Column("netmask", sa.String(length=45), nullable=True),
         sa.Column("gateway", sa.String(length=45), nullable=True),
@@ -35,7 +35,6 @@ def upgrade() -> None:
         sa.Column("device_location", sa.String(length=255), nullable=True),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_anpr_cameras_id"), "anpr_cameras", ["id"], unique=False)
     op.create_index(op.f("ix_anpr_cameras_mac"), "anpr_cameras", ["mac"], unique=True)
     op.create_index(op.f("ix_anpr_cameras_ipaddress"), "anpr_cameras", ["ipaddress"], unique=True)
 
@@ -70,7 +69,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["camera_id"], ["anpr_cameras.id"], ondelete="SET NULL"),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_lpr_events_id"), "lpr_events", ["id"], unique=False)
     op.create_index(op.f("ix_lpr_events_camera_id"), "lpr_events", ["camera_id"], unique=False)
     op.create_index(op.f("ix_lpr_events_device_ip"), "lpr_events", ["device_ip"], unique=False)
     op.create_index(op.f("ix_lpr_events_event_time"), "lpr_events", ["event_time"], unique=False)
@@ -158,11 +156,9 @@ def downgrade() -> None:
     op.drop_index(op.f("ix_lpr_events_event_time"), table_name="lpr_events")
     op.drop_index(op.f("ix_lpr_events_device_ip"), table_name="lpr_events")
     op.drop_index(op.f("ix_lpr_events_camera_id"), table_name="lpr_events")
-    op.drop_index(op.f("ix_lpr_events_id"), table_name="lpr_events")
     op.drop_table("lpr_events")
     op.drop_index(op.f("ix_anpr_cameras_ipaddress"), table_name="anpr_cameras")
     op.drop_index(op.f("ix_anpr_cameras_mac"), table_name="anpr_cameras")
-    op.drop_index(op.f("ix_anpr_cameras_id"), table_name="anpr_cameras")
     op.drop_table("anpr_cameras")
 
 
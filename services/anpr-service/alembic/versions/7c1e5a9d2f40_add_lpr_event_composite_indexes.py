@@ -0,0 +1,34 @@
+"""Add composite indexes for LPR event filters
+
+Revision ID: 7c1e5a9d2f40
+Revises: 4b2f19ae1c3d
+Create Date: 2025-11-24 09:30:00.000000
+"""
+from services.shared.database.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision = "7c1e5a9d2f40"
+down_revision = "4b2f19ae1c3d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite indexes are created first: MySQL refuses to drop
+    # ix_lpr_events_camera_id while it is the only index backing the
+    # camera_id foreign key.
+    create_index_online("ix_lpr_events_camera_time", "lpr_events", ["camera_id", "event_time"])
+    create_index_online("ix_lpr_events_type_time", "lpr_events", ["event_type", "event_time"])
+
+    # Both single-column indexes are now left prefixes of a composite one.
+    drop_index_online("ix_lpr_events_camera_id", "lpr_events")
+    drop_index_online("ix_lpr_events_event_type", "lpr_events")
+
+
+def downgrade() -> None:
+    create_index_online("ix_lpr_events_event_type", "lpr_events", ["event_type"])
+    create_index_online("ix_lpr_events_camera_id", "lpr_events", ["camera_id"])
+
+    drop_index_online("ix_lpr_events_type_time", "lpr_events")
+    drop_index_online("ix_lpr_events_camera_time", "lpr_events")
@@ -0,0 +1,24 @@
+"""Replace lpr_events.event_time index with a descending one
+
+Revision ID: a3d8f6b1c2e7
+Revises: 7c1e5a9d2f40
+Create Date: 2025-11-24 10:15:00.000000
+"""
+from services.shared.database.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision = "a3d8f6b1c2e7"
+down_revision = "7c1e5a9d2f40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_online("ix_lpr_events_event_time_desc", "lpr_events", ["event_time DESC", "id DESC"])
+    drop_index_online("ix_lpr_events_event_time", "lpr_events")
+
+
+def downgrade() -> None:
+    create_index_online("ix_lpr_events_event_time", "lpr_events", ["event_time"])
+    drop_index_online("ix_lpr_events_event_time_desc", "lpr_events")
@@ -0,0 +1,38 @@
+"""Drop redundant indexes on primary key columns
+
+Revision ID: d4e9b7a25c61
+Revises: a3d8f6b1c2e7
+Create Date: 2025-11-24 11:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from services.shared.database.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision = "d4e9b7a25c61"
+down_revision = "a3d8f6b1c2e7"
+branch_labels = None
+depends_on = None
+
+# (index name, table) pairs duplicating the clustered primary key.
+REDUNDANT_INDEXES = (
+    ("ix_anpr_cameras_id", "anpr_cameras"),
+    ("ix_lpr_events_id", "lpr_events"),
+)
+
+
+def upgrade() -> None:
+    # Databases created from 4b2f19ae1c3d after it stopped creating these
+    # indexes never had them.
+    inspector = sa.inspect(op.get_bind())
+    for name, table in REDUNDANT_INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        if name in existing:
+            drop_index_online(name, table)
+
+
+def downgrade() -> None:
+    for name, table in REDUNDANT_INDEXES:
+        create_index_online(name, table, ["id"])
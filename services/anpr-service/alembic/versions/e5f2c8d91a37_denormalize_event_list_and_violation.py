@@ -0,0 +1,42 @@
+"""Denormalize matched_list and violation_type onto lpr_events
+
+Revision ID: e5f2c8d91a37
+Revises: d4e9b7a25c61
+Create Date: 2025-11-25 09:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from services.shared.database.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision = "e5f2c8d91a37"
+down_revision = "d4e9b7a25c61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("lpr_events", sa.Column("matched_list", sa.String(length=64), nullable=True))
+    op.add_column("lpr_events", sa.Column("violation_type", sa.String(length=64), nullable=True))
+
+    op.execute(
+        "UPDATE lpr_events e JOIN list_events l ON l.event_id = e.id "
+        "SET e.matched_list = l.matched_list"
+    )
+    op.execute(
+        "UPDATE lpr_events e JOIN violation_events v ON v.event_id = e.id "
+        "SET e.violation_type = v.violation_type"
+    )
+
+    create_index_online("ix_lpr_events_matched_list_time", "lpr_events", ["matched_list", "event_time"])
+    create_index_online("ix_lpr_events_violation_type_time", "lpr_events", ["violation_type", "event_time"])
+
+
+def downgrade() -> None:
+    drop_index_online("ix_lpr_events_violation_type_time", "lpr_events")
+    drop_index_online("ix_lpr_events_matched_list_time", "lpr_events")
+
+    op.drop_column("lpr_events", "violation_type")
+    op.drop_column("lpr_events", "matched_list")
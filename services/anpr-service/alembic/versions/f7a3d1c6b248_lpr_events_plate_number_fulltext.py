@@ -0,0 +1,37 @@
+"""Add an ngram FULLTEXT index on lpr_events.plate_number
+
+Revision ID: f7a3d1c6b248
+Revises: e5f2c8d91a37
+Create Date: 2025-11-26 10:00:00.000000
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f7a3d1c6b248"
+down_revision = "e5f2c8d91a37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The ngram parser indexes every two-character window of the plate, so
+    # partial-plate searches can use MATCH ... AGAINST instead of a scan.
+    # InnoDB cannot add a first FULLTEXT index with LOCK=NONE; run this in a
+    # low-traffic window on large tables.
+    if op.get_context().dialect.name == "mysql":
+        # The default stopword list holds single letters and the ngram parser
+        # drops any token containing one; the index keeps the setting it was
+        # built with.
+        op.execute("SET SESSION innodb_ft_enable_stopword = OFF")
+    op.create_index(
+        "ft_lpr_events_plate_number",
+        "lpr_events",
+        ["plate_number"],
+        mysql_prefix="FULLTEXT",
+        mysql_with_parser="ngram",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ft_lpr_events_plate_number", table_name="lpr_events")
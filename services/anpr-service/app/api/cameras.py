@@ -3,7 +3,7 @@ Camera API routes for the ANPR service.
 """
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from services.shared.database.session import get_db
@@ -18,11 +18,15 @@ def list_cameras(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
-) -> List[CameraRead]:
+) -> Response:
     """
     Retrieve a paginated list of cameras.
     """
-    return CameraService(db).list_cameras(skip=skip, limit=limit)
+    # Encoded by the service with orjson; response_model documents the shape.
+    return Response(
+        content=CameraService(db).list_cameras_json(skip=skip, limit=limit),
+        media_type="application/json",
+    )
 
 
 @router.get("/{camera_id}", response_model=CameraRead)
@@ -51,12 +55,12 @@ def create_camera(
     Create a new camera entry.
     """
     service = CameraService(db)
-    if service.get_camera_by_mac(payload.mac):
+    if service.camera_exists_by_mac(payload.mac):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Camera with this MAC address already exists",
         )
-    if payload.ipaddress and service.get_camera_by_ip(payload.ipaddress):
+    if payload.ipaddress and service.camera_exists_by_ip(payload.ipaddress):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Camera with this IP address already exists",
@@ -1,31 +1,117 @@
 """
 LPR event API routes for the ANPR service.
+
+Ingest and listing run on the async engine so a request waiting on MySQL
+does not hold a threadpool worker; the service layer itself stays
+synchronous and is driven through ``AsyncSession.run_sync``.
 """
+import csv
+import io
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from services.shared.database.session import get_db
-from app.schemas import LprEventCreate, LprEventRead, LprEventList
+from services.shared.database.session import get_async_db, get_db
+from app.schemas import (
+    LprEventBulkResult,
+    LprEventCreate,
+    LprEventList,
+    LprEventListAdapter,
+    LprEventRead,
+)
 from app.services import EventService
-from app.services.event_service import CameraNotFoundError
+from app.services.event_service import EXPORT_COLUMNS, CameraNotFoundError
 
 router = APIRouter()
 
+# Ingest bodies are validated straight from the raw bytes by pydantic-core,
+# skipping the json.loads -> dict -> validate round trip FastAPI would do.
+_EVENT_ADAPTER = TypeAdapter(LprEventCreate)
+_EVENT_BATCH_ADAPTER = TypeAdapter(List[LprEventCreate])
 
-@router.post("/", response_model=LprEventRead, status_code=status.HTTP_201_CREATED)
-def create_event(
-    payload: LprEventCreate,
-    db: Session = Depends(get_db),
+
+def _decode_body(adapter: TypeAdapter, body: bytes) -> Any:
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]
+        ) from exc
+
+
+async def _event_payload(request: Request) -> LprEventCreate:
+    return _decode_body(_EVENT_ADAPTER, await request.body())
+
+
+async def _event_batch_payload(request: Request) -> List[LprEventCreate]:
+    return _decode_body(_EVENT_BATCH_ADAPTER, await request.body())
+
+
+def _request_body_docs(adapter: TypeAdapter) -> Dict[str, Any]:
+    """OpenAPI request body for a route that reads the raw body itself."""
+    schema = adapter.json_schema()
+    definitions = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}},
+        }
+    }
+
+
+@router.post(
+    "/",
+    response_model=LprEventRead,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=_request_body_docs(_EVENT_ADAPTER),
+)
+async def create_event(
+    payload: LprEventCreate = Depends(_event_payload),
+    db: AsyncSession = Depends(get_async_db),
 ) -> LprEventRead:
     """
     Ingest a new LPR event payload.
     """
-    service = EventService(db)
     try:
-        return service.create_event(payload)
+        return await db.run_sync(lambda session: EventService(session).create_event(payload))
+    except CameraNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+
+
+@router.post(
+    "/bulk",
+    response_model=LprEventBulkResult,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=_request_body_docs(_EVENT_BATCH_ADAPTER),
+)
+async def create_events_bulk(
+    payloads: List[LprEventCreate] = Depends(_event_batch_payload),
+    db: AsyncSession = Depends(get_async_db),
+) -> LprEventBulkResult:
+    """
+    Ingest a batch of LPR event payloads in as few round trips as possible.
+    """
+    try:
+        return await db.run_sync(lambda session: EventService(session).create_events_bulk(payloads))
     except CameraNotFoundError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +120,7 @@ def create_event(
 
 
 @router.get("/", response_model=List[LprEventList])
-def list_events(
+async def list_events(
     camera_id: Optional[int] = None,
     plate_number: Optional[str] = Query(default=None, min_length=3),
     event_type: Optional[str] = None,
@@ -42,14 +128,69 @@ def list_events(
     end_time: Optional[datetime] = None,
     matched_list: Optional[str] = None,
     violation_type: Optional[str] = None,
-    skip: int = 0,
+    after_time: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    skip: int = Query(default=0, ge=0, deprecated=True),
     limit: int = 100,
-    db: Session = Depends(get_db),
-) -> List[LprEventList]:
+    db: AsyncSession = Depends(get_async_db),
+) -> ORJSONResponse:
     """
     Retrieve a paginated list of LPR events with optional filters.
+
+    Pages are keyed on ``(event_time, id)``: when a full page is returned the
+    cursor for the next one is sent in the ``X-Next-After-Time`` and
+    ``X-Next-After-Id`` headers.
     """
-    return EventService(db).list_events(
+    if (after_time is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_time and after_id must be provided together",
+        )
+
+    events = await db.run_sync(
+        lambda session: EventService(session).list_events(
+            camera_id=camera_id,
+            plate_number=plate_number,
+            event_type=event_type,
+            start_time=start_time,
+            end_time=end_time,
+            matched_list=matched_list,
+            violation_type=violation_type,
+            after_time=after_time,
+            after_id=after_id,
+            skip=skip,
+            limit=limit,
+        )
+    )
+    headers = {}
+    if events and len(events) == limit:
+        last = events[-1]
+        headers["X-Next-After-Time"] = last.event_time.isoformat()
+        headers["X-Next-After-Id"] = str(last.id)
+
+    # Serialize the page in one pass and hand it straight to orjson; the
+    # response_model above is kept for the OpenAPI schema only.
+    return ORJSONResponse(
+        content=LprEventListAdapter.dump_python(events, mode="json", by_alias=True),
+        headers=headers,
+    )
+
+
+@router.get("/export")
+def export_events(
+    camera_id: Optional[int] = None,
+    plate_number: Optional[str] = Query(default=None, min_length=3),
+    event_type: Optional[str] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    matched_list: Optional[str] = None,
+    violation_type: Optional[str] = None,
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream all events matching the filters as CSV, newest first.
+    """
+    rows = EventService(db).export_events(
         camera_id=camera_id,
         plate_number=plate_number,
         event_type=event_type,
@@ -57,8 +198,11 @@ def list_events(
         end_time=end_time,
         matched_list=matched_list,
         violation_type=violation_type,
-        skip=skip,
-        limit=limit,
+    )
+    return StreamingResponse(
+        _iter_csv(rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="lpr_events.csv"'},
     )
 
 
@@ -79,3 +223,14 @@ def get_event(
     return event
 
 
+def _iter_csv(rows: Iterable, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
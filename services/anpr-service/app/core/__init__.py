@@ -2,6 +2,6 @@
 Core utilities for the ANPR service.
 """
 
-from .database import init_db  # noqa: F401
+from .database import create_indexes, init_db  # noqa: F401
 
 
@@ -0,0 +1,26 @@
+"""
+In-process caches of camera lookups.
+
+Only successful lookups are stored, and both caches are cleared whenever a
+transaction that wrote to ``anpr_cameras`` commits in this process; the TTL
+bounds how long other worker processes can serve a changed camera.
+"""
+from services.shared.cache import TTLCache, invalidate_after_commit
+
+from app.models import Camera
+
+
+# Lookup key (e.g. ``("ip", "10.0.0.5")``) -> camera id, used when resolving
+# the camera of an ingested event.
+camera_id_cache = TTLCache()
+
+# Lookup key -> CameraRead, used by the camera read endpoints.
+camera_read_cache = TTLCache(maxsize=4096)
+
+
+def invalidate_camera_caches() -> None:
+    camera_id_cache.clear()
+    camera_read_cache.clear()
+
+
+invalidate_after_commit((Camera,), invalidate_camera_caches)
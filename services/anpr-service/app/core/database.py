@@ -1,20 +1,77 @@
 """
 Database initialization utilities for the ANPR service.
 """
-from services.shared.database.session import engine
+from functools import lru_cache
+from typing import List
+
+from sqlalchemy import Index, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from services.shared.database.session import DATABASE_URL, engine
 from services.shared.database.base import Base
 
+# Tables whose secondary indexes can be built after an initial bulk load.
+BULK_LOAD_TABLES = ("lpr_events",)
 
-def init_db() -> None:
+
+def init_db(with_indexes: bool = True) -> None:
     """
     Initialize database tables for the ANPR service.
     Import models to ensure they are registered with SQLAlchemy metadata
     before creating the tables.
+
+    With ``with_indexes=False`` the non-unique secondary indexes of
+    ``BULK_LOAD_TABLES`` are skipped so a first backfill does not pay for
+    index maintenance on every row; call ``create_indexes()`` once the load
+    has finished.
     """
     # Import models to register them with the Base metadata
     from app import models  # noqa: F401
 
-    Base.metadata.create_all(bind=engine)
+    if with_indexes:
+        Base.metadata.create_all(bind=engine)
+        return
+
+    deferred = _deferred_indexes()
+    for index in deferred:
+        index.table.indexes.discard(index)
+    try:
+        Base.metadata.create_all(bind=engine)
+    finally:
+        for index in deferred:
+            index.table.indexes.add(index)
+
+
+def create_indexes() -> None:
+    """
+    Build the secondary indexes skipped by ``init_db(with_indexes=False)``.
+    """
+    from app import models  # noqa: F401
+
+    with engine.begin() as connection:
+        if connection.dialect.name == "mysql":
+            # Keep the plate FULLTEXT index usable with the ngram parser (see
+            # app.models.event).
+            connection.exec_driver_sql("SET SESSION innodb_ft_enable_stopword = OFF")
+        for index in _deferred_indexes():
+            index.create(bind=connection, checkfirst=True)
+
+
+@lru_cache(maxsize=1)
+def get_bulk_load_engine() -> Engine:
+    """
+    Engine whose connections may run ``LOAD DATA LOCAL INFILE``.
+
+    Kept separate from the request engine so the client-side file capability
+    is only enabled for backfills; the server must also have
+    ``local_infile=ON``.
+    """
+    return create_engine(
+        DATABASE_URL,
+        connect_args={"local_infile": True},
+        poolclass=NullPool,
+    )
 
 
 def drop_db() -> None:
@@ -26,3 +83,11 @@ def drop_db() -> None:
     Base.metadata.drop_all(bind=engine)
 
 
+def _deferred_indexes() -> List[Index]:
+    # Unique indexes stay in place: they enforce integrity during the load.
+    return [
+        index
+        for table_name in BULK_LOAD_TABLES
+        for index in Base.metadata.tables[table_name].indexes
+        if not index.unique
+    ]
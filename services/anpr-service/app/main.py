@@ -3,8 +3,9 @@ ANPR Service Main Application
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from services.shared.config.settings import settings
-from services.shared.middleware import configure_request_logging
+from services.shared.middleware import HealthCheckMiddleware, configure_request_logging
 from services.shared.utils.logger import setup_logger
 from app.api import api_router
 
@@ -16,6 +17,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Middleware
@@ -23,8 +25,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=settings.CORS_EXPOSE_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
 )
 
 # Request logging middleware
@@ -36,6 +40,9 @@ configure_request_logging(
     log_headers=("x-request-id", "x-forwarded-for"),
 )
 
+# Health probes (added last, so outermost) skip the middleware above
+app.add_middleware(HealthCheckMiddleware, service_name="anpr-service")
+
 # Include API routers
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
@@ -54,5 +61,15 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    import os
+
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        access_log=False,
+    )
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, false, true
 from sqlalchemy.orm import relationship
 
 from services.shared.database.base import BaseModel
@@ -18,12 +18,14 @@ class Camera(BaseModel):
 
     __tablename__ = "anpr_cameras"
 
+    # The primary key is already indexed; skip BaseModel's extra index on id.
+    id = Column(Integer, primary_key=True, autoincrement=True)
     model = Column(String(255), nullable=False)
     mac = Column(String(32), unique=True, nullable=False, index=True)
     firmware_version = Column(String(128), nullable=True)
     system_boot_time = Column(DateTime(timezone=True), nullable=True)
-    wireless = Column(Boolean, nullable=False, default=False)
-    dhcp_enable = Column(Boolean, nullable=False, default=True)
+    wireless = Column(Boolean, nullable=False, default=False, server_default=false())
+    dhcp_enable = Column(Boolean, nullable=False, default=True, server_default=true())
     ipaddress = Column(String(45), unique=True, nullable=True, index=True)
     netmask = Column(String(45), nullable=True)
     gateway = Column(String(45), nullable=True)
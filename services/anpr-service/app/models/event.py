@@ -7,16 +7,19 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     Column,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.orm import relationship
 
@@ -29,12 +32,32 @@ class LprEvent(BaseModel):
     """
 
     __tablename__ = "lpr_events"
+    __table_args__ = (
+        # Composite indexes matching the /events filter shapes; the leading
+        # column also serves equality lookups (and the camera_id foreign key).
+        Index("ix_lpr_events_camera_time", "camera_id", "event_time"),
+        Index("ix_lpr_events_type_time", "event_type", "event_time"),
+        Index("ix_lpr_events_matched_list_time", "matched_list", "event_time"),
+        Index("ix_lpr_events_violation_type_time", "violation_type", "event_time"),
+        # Partial-plate search (MATCH ... AGAINST in boolean mode).
+        Index(
+            "ft_lpr_events_plate_number",
+            "plate_number",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+    )
+
+    # The primary key is already indexed; skip BaseModel's extra index on id.
+    id = Column(Integer, primary_key=True, autoincrement=True)
 
+    # InnoDB cannot defer foreign key checks; the SET NULL cascade on camera
+    # delete finds its rows through ix_lpr_events_camera_time instead of a
+    # table scan.
     camera_id = Column(
         Integer,
         ForeignKey("anpr_cameras.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
 
     # Device info
@@ -46,7 +69,7 @@ class LprEvent(BaseModel):
     # Event info
     event_type = Column(String(50), nullable=False)
     event_uid = Column(String(255), nullable=False, unique=True, index=True)
-    event_time = Column(DateTime(timezone=True), nullable=False, index=True)
+    event_time = Column(DateTime(timezone=True), nullable=False)
     event_description = Column(String(512), nullable=True)
 
     # Plate info
@@ -56,6 +79,7 @@ class LprEvent(BaseModel):
     vehicle_type = Column(String(32), nullable=True)
     vehicle_brand = Column(String(64), nullable=True)
     travel_direction = Column(String(16), nullable=True)
+    # Float renders as single-precision (4-byte) FLOAT on MySQL.
     speed = Column(Float, nullable=True)
     confidence = Column(Integer, nullable=True)
     image_url = Column(String(512), nullable=True)
@@ -66,11 +90,17 @@ class LprEvent(BaseModel):
     plate_roi_width = Column(Integer, nullable=True)
     plate_roi_height = Column(Integer, nullable=True)
 
+    # Copies of list_events.matched_list / violation_events.violation_type so
+    # listings can filter and render without touching the child tables.
+    matched_list = Column(String(64), nullable=True)
+    violation_type = Column(String(64), nullable=True)
+
     camera = relationship("Camera", back_populates="events")
     list_event = relationship(
         "ListEvent",
         uselist=False,
         back_populates="event",
+        lazy="raise",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -78,6 +108,7 @@ class LprEvent(BaseModel):
         "AttributeEvent",
         uselist=False,
         back_populates="event",
+        lazy="raise",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -85,6 +116,7 @@ class LprEvent(BaseModel):
         "ViolationEvent",
         uselist=False,
         back_populates="event",
+        lazy="raise",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -92,6 +124,7 @@ class LprEvent(BaseModel):
         "VehicleCountingEvent",
         uselist=False,
         back_populates="event",
+        lazy="raise",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -100,6 +133,20 @@ class LprEvent(BaseModel):
         return f"<LprEvent(id={self.id}, plate={self.plate_number}, time={self.event_time})>"
 
 
+# Newest-first listings scan this index forwards instead of walking an
+# ascending one backwards; id breaks ties between events in the same second.
+Index("ix_lpr_events_event_time_desc", LprEvent.event_time.desc(), LprEvent.id.desc())
+
+# InnoDB's default stopword list contains single letters, and the ngram parser
+# drops every token containing a stopword; FULLTEXT indexes capture the
+# setting when they are built, so switch it off for the CREATE TABLE.
+event.listen(
+    LprEvent.__table__,
+    "before_create",
+    DDL("SET SESSION innodb_ft_enable_stopword = OFF").execute_if(dialect="mysql"),
+)
+
+
 class ListEvent(BaseModel):
     """
     Represents a list-match event associated with an LPR event.
@@ -15,6 +15,8 @@ from .event import (  # noqa: F401
     LprEventCreate,
     LprEventRead,
     LprEventList,
+    LprEventListAdapter,
+    LprEventBulkResult,
 )
 
 __all__ = [
@@ -32,6 +34,8 @@ __all__ = [
     "LprEventCreate",
     "LprEventRead",
     "LprEventList",
+    "LprEventListAdapter",
+    "LprEventBulkResult",
 ]
 
 
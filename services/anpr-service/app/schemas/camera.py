@@ -4,9 +4,44 @@ Pydantic schemas for camera operations.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, AliasChoices, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Non-ISO layouts some camera firmwares report, tried after fromisoformat.
+_LEGACY_BOOT_TIME_FORMATS = (
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+)
+
+
+@lru_cache(maxsize=512)
+def _parse_boot_time(value: str) -> datetime:
+    # A camera reports the same boot time until it restarts, so repeated
+    # provisioning/update calls hit the cache.
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    for fmt in _LEGACY_BOOT_TIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+
+    raise ValueError(f"Invalid systemBootTime format: {value}")
+
+
+def _validate_boot_time(value: Any) -> Any:
+    """Parse camera-reported boot time strings once, at the schema boundary."""
+    if value == "":
+        return None
+    if isinstance(value, str):
+        return _parse_boot_time(value)
+    return value
 
 
 def _alias(name: str) -> str:
@@ -34,14 +69,14 @@ class CameraBase(BaseModel):
     firmware_version: Optional[str] = Field(
         default=None,
         max_length=128,
-        validation_alias=AliasChoices("firmwareVersion", "firmware_version"),
+        validation_alias="firmwareVersion",
         serialization_alias="firmwareVersion",
     )
-    system_boot_time: Optional[str] = Field(
+    system_boot_time: Optional[datetime] = Field(
         default=None,
-        validation_alias=AliasChoices("systemBootTime", "system_boot_time"),
+        validation_alias="systemBootTime",
         serialization_alias="systemBootTime",
-        description="System boot timestamp in string format",
+        description="System boot timestamp (ISO 8601 or dd/mm/yyyy HH:MM:SS)",
     )
     wireless: Optional[bool] = Field(
         default=False,
@@ -49,7 +84,7 @@ class CameraBase(BaseModel):
     )
     dhcp_enable: Optional[bool] = Field(
         default=True,
-        validation_alias=AliasChoices("dhcpEnable", "dhcp_enable"),
+        validation_alias="dhcpEnable",
         serialization_alias="dhcpEnable",
         description="DHCP enablement flag",
     )
@@ -67,17 +102,22 @@ class CameraBase(BaseModel):
     )
     device_name: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("deviceName", "device_name"),
+        validation_alias="deviceName",
         serialization_alias="deviceName",
         description="Human-friendly device name",
     )
     device_location: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("deviceLocation", "device_location"),
+        validation_alias="deviceLocation",
         serialization_alias="deviceLocation",
         description="Physical location of the camera",
     )
 
+    @field_validator("system_boot_time", mode="before")
+    @classmethod
+    def _parse_system_boot_time(cls, value: Any) -> Any:
+        return _validate_boot_time(value)
+
 
 class CameraCreate(CameraBase):
     """
@@ -99,18 +139,18 @@ class CameraUpdate(BaseModel):
     firmware_version: Optional[str] = Field(
         default=None,
         max_length=128,
-        validation_alias=AliasChoices("firmwareVersion", "firmware_version"),
+        validation_alias="firmwareVersion",
         serialization_alias="firmwareVersion",
     )
-    system_boot_time: Optional[str] = Field(
+    system_boot_time: Optional[datetime] = Field(
         default=None,
-        validation_alias=AliasChoices("systemBootTime", "system_boot_time"),
+        validation_alias="systemBootTime",
         serialization_alias="systemBootTime",
     )
     wireless: Optional[bool] = Field(default=None)
     dhcp_enable: Optional[bool] = Field(
         default=None,
-        validation_alias=AliasChoices("dhcpEnable", "dhcp_enable"),
+        validation_alias="dhcpEnable",
         serialization_alias="dhcpEnable",
     )
     ipaddress: Optional[str] = Field(default=None)
@@ -118,15 +158,20 @@ class CameraUpdate(BaseModel):
     gateway: Optional[str] = Field(default=None)
     device_name: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("deviceName", "device_name"),
+        validation_alias="deviceName",
         serialization_alias="deviceName",
     )
     device_location: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("deviceLocation", "device_location"),
+        validation_alias="deviceLocation",
         serialization_alias="deviceLocation",
     )
 
+    @field_validator("system_boot_time", mode="before")
+    @classmethod
+    def _parse_system_boot_time(cls, value: Any) -> Any:
+        return _validate_boot_time(value)
+
 
 class CameraRead(CameraBase):
     """
@@ -138,9 +183,3 @@ class CameraRead(CameraBase):
     id: int
     created_at: datetime = Field(serialization_alias="createdAt")
     updated_at: datetime = Field(serialization_alias="updatedAt")
-
-    @field_serializer("created_at", "updated_at", when_used="json")
-    def serialize_datetime(self, value: datetime) -> str:
-        return value.isoformat()
-
-
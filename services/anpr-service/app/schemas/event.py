@@ -4,312 +4,298 @@ Pydantic schemas for LPR event operations.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, List, Optional
 
 from pydantic import (
     AliasChoices,
     BaseModel,
     ConfigDict,
     Field,
-    field_serializer,
+    TypeAdapter,
 )
+from typing_extensions import TypedDict
 
 
 class DeviceInfoSchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     device_name: str = Field(
         ...,
-        validation_alias=AliasChoices("DeviceName", "deviceName", "device_name"),
+        validation_alias=AliasChoices("DeviceName", "deviceName"),
         serialization_alias="DeviceName",
     )
     device_ip: str = Field(
         ...,
-        validation_alias=AliasChoices("DeviceIP", "deviceIp", "device_ip"),
+        validation_alias=AliasChoices("DeviceIP", "deviceIp"),
         serialization_alias="DeviceIP",
     )
     device_model: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("DeviceModel", "deviceModel", "device_model"),
+        validation_alias=AliasChoices("DeviceModel", "deviceModel"),
         serialization_alias="DeviceModel",
     )
     firmware_version: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("FirmwareVersion", "firmwareVersion", "firmware_version"),
+        validation_alias=AliasChoices("FirmwareVersion", "firmwareVersion"),
         serialization_alias="FirmwareVersion",
     )
 
 
 class EventInfoSchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     event_type: str = Field(
         ...,
-        validation_alias=AliasChoices("EventType", "eventType", "event_type"),
+        validation_alias=AliasChoices("EventType", "eventType"),
         serialization_alias="EventType",
     )
     event_id: str = Field(
         ...,
-        validation_alias=AliasChoices("EventID", "eventId", "event_id"),
+        validation_alias=AliasChoices("EventID", "eventId"),
         serialization_alias="EventID",
     )
     event_time: datetime = Field(
         ...,
-        validation_alias=AliasChoices("EventTime", "eventTime", "event_time"),
+        validation_alias=AliasChoices("EventTime", "eventTime"),
         serialization_alias="EventTime",
     )
     event_description: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("EventDescription", "eventDescription", "event_description"),
+        validation_alias=AliasChoices("EventDescription", "eventDescription"),
         serialization_alias="EventDescription",
     )
 
-    @field_serializer("event_time", when_used="json")
-    def serialize_event_time(self, value: datetime) -> str:
-        return value.isoformat()
 
+class PlateROISchema(TypedDict):
+    """
+    Plate bounding box. Validated into a plain dict rather than a model
+    instance, since it is only ever copied into four event columns.
+    """
 
-class PlateROISchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    __pydantic_config__ = ConfigDict(populate_by_name=True)
 
-    x: int = Field(
-        ...,
-        validation_alias=AliasChoices("X", "x"),
-        serialization_alias="X",
-    )
-    y: int = Field(
-        ...,
-        validation_alias=AliasChoices("Y", "y"),
-        serialization_alias="Y",
-    )
-    width: int = Field(
-        ...,
-        validation_alias=AliasChoices("Width", "width"),
-        serialization_alias="Width",
-    )
-    height: int = Field(
-        ...,
-        validation_alias=AliasChoices("Height", "height"),
-        serialization_alias="Height",
-    )
+    x: Annotated[int, Field(validation_alias="X", serialization_alias="X")]
+    y: Annotated[int, Field(validation_alias="Y", serialization_alias="Y")]
+    width: Annotated[int, Field(validation_alias="Width", serialization_alias="Width")]
+    height: Annotated[int, Field(validation_alias="Height", serialization_alias="Height")]
 
 
 class PlateInfoSchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     plate_number: str = Field(
         ...,
-        validation_alias=AliasChoices("PlateNumber", "plateNumber", "plate_number"),
+        validation_alias=AliasChoices("PlateNumber", "plateNumber"),
         serialization_alias="PlateNumber",
     )
     plate_color: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("PlateColor", "plateColor", "plate_color"),
+        validation_alias=AliasChoices("PlateColor", "plateColor"),
         serialization_alias="PlateColor",
     )
     vehicle_color: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("VehicleColor", "vehicleColor", "vehicle_color"),
+        validation_alias=AliasChoices("VehicleColor", "vehicleColor"),
         serialization_alias="VehicleColor",
     )
     vehicle_type: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("VehicleType", "vehicleType", "vehicle_type"),
+        validation_alias=AliasChoices("VehicleType", "vehicleType"),
         serialization_alias="VehicleType",
     )
     brand: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("Brand", "brand"),
+        validation_alias="Brand",
         serialization_alias="Brand",
     )
     direction: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("Direction", "direction"),
+        validation_alias="Direction",
         serialization_alias="Direction",
     )
     speed: Optional[float] = Field(
         default=None,
-        validation_alias=AliasChoices("Speed", "speed"),
+        validation_alias="Speed",
         serialization_alias="Speed",
     )
     confidence: Optional[int] = Field(
         default=None,
-        validation_alias=AliasChoices("Confidence", "confidence"),
+        validation_alias="Confidence",
         serialization_alias="Confidence",
     )
     plate_roi: Optional[PlateROISchema] = Field(
         default=None,
-        validation_alias=AliasChoices("PlateROI", "plateROI", "plate_roi"),
+        validation_alias=AliasChoices("PlateROI", "plateROI"),
         serialization_alias="PlateROI",
     )
     image_url: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("ImageURL", "imageUrl", "image_url"),
+        validation_alias=AliasChoices("ImageURL", "imageUrl"),
         serialization_alias="ImageURL",
     )
 
 
 class ListEventSchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     matched_list: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("MatchedList", "matchedList", "matched_list"),
+        validation_alias=AliasChoices("MatchedList", "matchedList"),
         serialization_alias="MatchedList",
     )
     list_id: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("ListID", "listId", "list_id"),
+        validation_alias=AliasChoices("ListID", "listId"),
         serialization_alias="ListID",
     )
     matched_by: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("MatchedBy", "matchedBy", "matched_by"),
+        validation_alias=AliasChoices("MatchedBy", "matchedBy"),
         serialization_alias="MatchedBy",
     )
     confidence: Optional[int] = Field(
         default=None,
-        validation_alias=AliasChoices("Confidence", "confidence"),
+        validation_alias="Confidence",
         serialization_alias="Confidence",
     )
     description: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("ListDescription", "listDescription", "list_description", "description"),
+        validation_alias=AliasChoices("ListDescription", "listDescription", "list_description"),
         serialization_alias="ListDescription",
     )
 
 
 class AttributeEventSchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     vehicle_presence: Optional[bool] = Field(
         default=None,
-        validation_alias=AliasChoices("VehiclePresence", "vehiclePresence", "vehicle_presence"),
+        validation_alias=AliasChoices("VehiclePresence", "vehiclePresence"),
         serialization_alias="VehiclePresence",
     )
     vehicle_make: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("VehicleMake", "vehicleMake", "vehicle_make"),
+        validation_alias=AliasChoices("VehicleMake", "vehicleMake"),
         serialization_alias="VehicleMake",
     )
     vehicle_color: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("VehicleColor", "vehicleColor", "vehicle_color"),
+        validation_alias=AliasChoices("VehicleColor", "vehicleColor"),
         serialization_alias="VehicleColor",
     )
     vehicle_size: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("VehicleSize", "vehicleSize", "vehicle_size"),
+        validation_alias=AliasChoices("VehicleSize", "vehicleSize"),
         serialization_alias="VehicleSize",
     )
     vehicle_direction: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("VehicleDirection", "vehicleDirection", "vehicle_direction"),
+        validation_alias=AliasChoices("VehicleDirection", "vehicleDirection"),
         serialization_alias="VehicleDirection",
     )
 
 
 class ViolationEventSchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     violation_type: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("ViolationType", "violationType", "violation_type"),
+        validation_alias=AliasChoices("ViolationType", "violationType"),
         serialization_alias="ViolationType",
     )
     speed_limit: Optional[float] = Field(
         default=None,
-        validation_alias=AliasChoices("SpeedLimit", "speedLimit", "speed_limit"),
+        validation_alias=AliasChoices("SpeedLimit", "speedLimit"),
         serialization_alias="SpeedLimit",
     )
     measured_speed: Optional[float] = Field(
         default=None,
-        validation_alias=AliasChoices("MeasuredSpeed", "measuredSpeed", "measured_speed"),
+        validation_alias=AliasChoices("MeasuredSpeed", "measuredSpeed"),
         serialization_alias="MeasuredSpeed",
     )
     violation_status: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("ViolationStatus", "violationStatus", "violation_status"),
+        validation_alias=AliasChoices("ViolationStatus", "violationStatus"),
         serialization_alias="ViolationStatus",
     )
     violation_image: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("ViolationImage", "violationImage", "violation_image"),
+        validation_alias=AliasChoices("ViolationImage", "violationImage"),
         serialization_alias="ViolationImage",
     )
 
 
 class VehicleCountingSchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     lane_id: Optional[int] = Field(
         default=None,
-        validation_alias=AliasChoices("LaneID", "laneId", "lane_id"),
+        validation_alias=AliasChoices("LaneID", "laneId"),
         serialization_alias="LaneID",
     )
     counting_region: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("CountingRegion", "countingRegion", "counting_region"),
+        validation_alias=AliasChoices("CountingRegion", "countingRegion"),
         serialization_alias="CountingRegion",
     )
     count_in: Optional[int] = Field(
         default=None,
-        validation_alias=AliasChoices("CountIn", "countIn", "count_in"),
+        validation_alias=AliasChoices("CountIn", "countIn"),
         serialization_alias="CountIn",
     )
     count_out: Optional[int] = Field(
         default=None,
-        validation_alias=AliasChoices("CountOut", "countOut", "count_out"),
+        validation_alias=AliasChoices("CountOut", "countOut"),
         serialization_alias="CountOut",
     )
     current_count: Optional[int] = Field(
         default=None,
-        validation_alias=AliasChoices("CurrentCount", "currentCount", "current_count"),
+        validation_alias=AliasChoices("CurrentCount", "currentCount"),
         serialization_alias="CurrentCount",
     )
 
 
 class LprEventCreate(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     camera_id: Optional[int] = Field(
         default=None,
-        validation_alias=AliasChoices("cameraId", "camera_id"),
+        validation_alias="cameraId",
         serialization_alias="cameraId",
     )
     device_info: DeviceInfoSchema = Field(
         ...,
-        validation_alias=AliasChoices("DeviceInfo", "deviceInfo", "device_info"),
+        validation_alias=AliasChoices("DeviceInfo", "deviceInfo"),
         serialization_alias="DeviceInfo",
     )
     event_info: EventInfoSchema = Field(
         ...,
-        validation_alias=AliasChoices("EventInfo", "eventInfo", "event_info"),
+        validation_alias=AliasChoices("EventInfo", "eventInfo"),
         serialization_alias="EventInfo",
     )
     plate_info: PlateInfoSchema = Field(
         ...,
-        validation_alias=AliasChoices("PlateInfo", "plateInfo", "plate_info"),
+        validation_alias=AliasChoices("PlateInfo", "plateInfo"),
         serialization_alias="PlateInfo",
     )
     list_event: Optional[ListEventSchema] = Field(
         default=None,
-        validation_alias=AliasChoices("ListEvent", "listEvent", "list_event"),
+        validation_alias=AliasChoices("ListEvent", "listEvent"),
         serialization_alias="ListEvent",
     )
     attribute_event: Optional[AttributeEventSchema] = Field(
         default=None,
-        validation_alias=AliasChoices("AttributeEvent", "attributeEvent", "attribute_event"),
+        validation_alias=AliasChoices("AttributeEvent", "attributeEvent"),
         serialization_alias="AttributeEvent",
     )
     violation_event: Optional[ViolationEventSchema] = Field(
         default=None,
-        validation_alias=AliasChoices("ViolationEvent", "violationEvent", "violation_event"),
+        validation_alias=AliasChoices("ViolationEvent", "violationEvent"),
         serialization_alias="ViolationEvent",
     )
     vehicle_counting: Optional[VehicleCountingSchema] = Field(
         default=None,
-        validation_alias=AliasChoices("VehicleCounting", "vehicleCounting", "vehicle_counting"),
+        validation_alias=AliasChoices("VehicleCounting", "vehicleCounting"),
         serialization_alias="VehicleCounting",
     )
 
@@ -329,10 +315,6 @@ class LprEventRead(BaseModel):
     created_at: datetime = Field(serialization_alias="createdAt")
     updated_at: datetime = Field(serialization_alias="updatedAt")
 
-    @field_serializer("created_at", "updated_at", when_used="json")
-    def serialize_datetime(self, value: datetime) -> str:
-        return value.isoformat()
-
 
 class LprEventList(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
@@ -350,8 +332,13 @@ class LprEventList(BaseModel):
     confidence: Optional[int] = Field(default=None, serialization_alias="confidence")
     image_url: Optional[str] = Field(default=None, serialization_alias="imageUrl")
 
-    @field_serializer("event_time", when_used="json")
-    def serialize_event_time(self, value: datetime) -> str:
-        return value.isoformat()
 
+# Validates/serializes whole pages of LprEventList in a single call.
+LprEventListAdapter = TypeAdapter(List[LprEventList])
+
+
+class LprEventBulkResult(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
 
+    created: int
+    event_ids: List[int] = Field(default_factory=list, serialization_alias="eventIds")
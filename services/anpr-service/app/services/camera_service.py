@@ -3,16 +3,61 @@ Camera service layer.
 """
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Union
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import Row, lambda_stmt, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from app.core.camera_cache import camera_read_cache
 from app.models import Camera
 from app.schemas import CameraCreate, CameraUpdate, CameraRead
 
 
+# Columns read by CameraRead, selected directly for list queries.
+_CAMERA_COLUMNS = (
+    Camera.id,
+    Camera.model,
+    Camera.mac,
+    Camera.firmware_version,
+    Camera.system_boot_time,
+    Camera.wireless,
+    Camera.dhcp_enable,
+    Camera.ipaddress,
+    Camera.netmask,
+    Camera.gateway,
+    Camera.device_name,
+    Camera.device_location,
+    Camera.created_at,
+    Camera.updated_at,
+)
+
+
+# CameraCreate fields copied onto a new Camera.
+_CAMERA_CREATE_FIELDS = (
+    "model",
+    "mac",
+    "firmware_version",
+    "system_boot_time",
+    "wireless",
+    "dhcp_enable",
+    "ipaddress",
+    "netmask",
+    "gateway",
+    "device_name",
+    "device_location",
+)
+
+
+class CameraSummary(NamedTuple):
+    """Identifying columns of a camera, for callers that need no more."""
+
+    id: int
+    model: str
+    mac: str
+
+
 class CameraService:
     """
     Business logic for camera operations.
@@ -25,111 +70,164 @@ class CameraService:
     # Query helpers
     # ---------------------------------------------------------------------
     def list_cameras(self, skip: int = 0, limit: int = 100) -> List[CameraRead]:
-        stmt = select(Camera).offset(skip).limit(limit)
-        cameras = self.db.execute(stmt).scalars().all()
-        return [self._to_read_schema(camera) for camera in cameras]
+        # Plain column rows: no ORM identity map or instance state per camera.
+        stmt = select(*_CAMERA_COLUMNS).offset(skip).limit(limit)
+        rows = self.db.execute(stmt).all()
+        return [self._to_read_schema(row) for row in rows]
+
+    def list_cameras_json(self, skip: int = 0, limit: int = 100) -> bytes:
+        """
+        Same page as ``list_cameras``, encoded straight to the JSON the
+        endpoint would produce (serialization aliases, ISO datetimes)
+        without building ``CameraRead`` models.
+        """
+        stmt = select(*_CAMERA_COLUMNS).offset(skip).limit(limit)
+        rows = self.db.execute(stmt).all()
+        return orjson.dumps(
+            [
+                {
+                    "model": row.model,
+                    "mac": row.mac,
+                    "firmwareVersion": row.firmware_version,
+                    "systemBootTime": row.system_boot_time,
+                    "wireless": row.wireless,
+                    "dhcpEnable": row.dhcp_enable,
+                    "ipaddress": row.ipaddress,
+                    "netmask": row.netmask,
+                    "gateway": row.gateway,
+                    "deviceName": row.device_name,
+                    "deviceLocation": row.device_location,
+                    "id": row.id,
+                    "createdAt": row.created_at,
+                    "updatedAt": row.updated_at,
+                }
+                for row in rows
+            ]
+        )
 
     def get_camera(self, camera_id: int) -> Optional[CameraRead]:
-        camera = self.db.get(Camera, camera_id)
-        return self._to_read_schema(camera) if camera else None
+        return self._cached_lookup(
+            ("id", camera_id),
+            lambda_stmt(lambda: select(Camera).where(Camera.id == camera_id)),
+        )
 
     def get_camera_by_mac(self, mac: str) -> Optional[CameraRead]:
-        stmt = select(Camera).where(Camera.mac == mac)
-        camera = self.db.execute(stmt).scalar_one_or_none()
-        return self._to_read_schema(camera) if camera else None
+        return self._cached_lookup(
+            ("mac", mac),
+            lambda_stmt(lambda: select(Camera).where(Camera.mac == mac)),
+        )
 
     def get_camera_by_ip(self, ipaddress: str) -> Optional[CameraRead]:
-        stmt = select(Camera).where(Camera.ipaddress == ipaddress)
-        camera = self.db.execute(stmt).scalar_one_or_none()
-        return self._to_read_schema(camera) if camera else None
+        return self._cached_lookup(
+            ("ip", ipaddress),
+            lambda_stmt(lambda: select(Camera).where(Camera.ipaddress == ipaddress)),
+        )
+
+    def get_camera_by_mac_summary(self, mac: str) -> Optional[CameraSummary]:
+        row = self.db.execute(
+            select(Camera.id, Camera.model, Camera.mac).where(Camera.mac == mac)
+        ).first()
+        return CameraSummary(*row) if row else None
+
+    def camera_exists_by_mac(self, mac: str) -> bool:
+        return self._exists(
+            lambda_stmt(lambda: select(Camera.id).where(Camera.mac == mac).limit(1))
+        )
+
+    def camera_exists_by_ip(self, ipaddress: str) -> bool:
+        return self._exists(
+            lambda_stmt(lambda: select(Camera.id).where(Camera.ipaddress == ipaddress).limit(1))
+        )
 
     # ---------------------------------------------------------------------
     # Mutations
     # ---------------------------------------------------------------------
     def create_camera(self, payload: CameraCreate) -> CameraRead:
-        data = payload.model_dump(by_alias=False, exclude_none=True)
-        system_boot_time_str = data.pop("system_boot_time", None)
-
-        camera = Camera(**data)
-        camera.system_boot_time = self._parse_system_boot_time(system_boot_time_str)
+        # Read the validated values straight from the model instead of
+        # model_dump(); None is skipped so column defaults still apply.
+        values = payload.__dict__
+        camera = Camera(
+            **{
+                field: values[field]
+                for field in _CAMERA_CREATE_FIELDS
+                if values[field] is not None
+            }
+        )
 
         self.db.add(camera)
         self.db.commit()
-        self.db.refresh(camera)
+        # Only the timestamps are server-generated; the rest is still loaded.
+        self.db.refresh(camera, attribute_names=["created_at", "updated_at"])
 
         return self._to_read_schema(camera)
 
     def update_camera(self, camera_id: int, payload: CameraUpdate) -> CameraRead:
-        camera = self.db.get(Camera, camera_id)
-        if not camera:
-            raise ValueError(f"Camera {camera_id} not found")
-
         update_data = payload.model_dump(by_alias=False, exclude_unset=True)
-        system_boot_time_str = update_data.pop("system_boot_time", None)
-
-        for field, value in update_data.items():
-            setattr(camera, field, value)
-
-        if system_boot_time_str is not None:
-            camera.system_boot_time = self._parse_system_boot_time(system_boot_time_str)
-
-        self.db.add(camera)
-        self.db.commit()
-        self.db.refresh(camera)
+        # An explicit null boot time leaves the stored value untouched.
+        if "system_boot_time" in update_data and update_data["system_boot_time"] is None:
+            del update_data["system_boot_time"]
+
+        if update_data:
+            # One UPDATE statement instead of loading the instance and
+            # setting each attribute; updated_at still gets its onupdate.
+            result = self.db.execute(
+                update(Camera).where(Camera.id == camera_id).values(**update_data)
+            )
+            if result.rowcount == 0:
+                self.db.rollback()
+                raise ValueError(f"Camera {camera_id} not found")
+            self.db.commit()
+
+        row = self.db.execute(
+            select(*_CAMERA_COLUMNS).where(Camera.id == camera_id)
+        ).first()
+        if row is None:
+            raise ValueError(f"Camera {camera_id} not found")
 
-        return self._to_read_schema(camera)
+        return self._to_read_schema(row)
 
     # ---------------------------------------------------------------------
     # Internal utilities
     # ---------------------------------------------------------------------
-    @staticmethod
-    def _parse_system_boot_time(value: Optional[str]) -> Optional[datetime]:
-        if not value:
+    def _cached_lookup(self, cache_key: tuple, stmt: StatementLambdaElement) -> Optional[CameraRead]:
+        # Callers pass lambda_stmt() statements, which SQLAlchemy caches per
+        # call site, so repeated misses only rebind the lookup value.
+        cached = camera_read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        camera = self.db.execute(stmt).scalar_one_or_none()
+        if camera is None:
             return None
 
-        parsers = [
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S",
-            "%d/%m/%Y %H:%M:%S",
-            "%m/%d/%Y %H:%M:%S",
-        ]
-
-        for fmt in parsers:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-
-        # Fallback: try ISO parsing without raising
-        try:
-            return datetime.fromisoformat(value)
-        except ValueError as exc:
-            raise ValueError(f"Invalid systemBootTime format: {value}") from exc
+        camera_read = self._to_read_schema(camera)
+        camera_read_cache.set(cache_key, camera_read)
+        return camera_read
+
+    def _exists(self, stmt: StatementLambdaElement) -> bool:
+        # Answered from the unique index alone; no row is hydrated.
+        return self.db.execute(stmt).scalar() is not None
 
     @staticmethod
-    def _to_read_schema(camera: Optional[Camera]) -> Optional[CameraRead]:
+    def _to_read_schema(camera: Optional[Union[Camera, Row]]) -> Optional[CameraRead]:
+        # Accepts ORM instances and rows selected from _CAMERA_COLUMNS alike.
         if not camera:
             return None
 
-        payload = {
-            "id": camera.id,
-            "model": camera.model,
-            "mac": camera.mac,
-            "firmware_version": camera.firmware_version,
-            "system_boot_time": camera.system_boot_time.isoformat()
-            if camera.system_boot_time
-            else None,
-            "wireless": camera.wireless,
-            "dhcp_enable": camera.dhcp_enable,
-            "ipaddress": camera.ipaddress,
-            "netmask": camera.netmask,
-            "gateway": camera.gateway,
-            "device_name": camera.device_name,
-            "device_location": camera.device_location,
-            "created_at": camera.created_at,
-            "updated_at": camera.updated_at,
-        }
-
-        return CameraRead.model_validate(payload)
-
-
+        # Rows come straight from the database, so skip pydantic validation.
+        return CameraRead.model_construct(
+            id=camera.id,
+            model=camera.model,
+            mac=camera.mac,
+            firmware_version=camera.firmware_version,
+            system_boot_time=camera.system_boot_time,
+            wireless=camera.wireless,
+            dhcp_enable=camera.dhcp_enable,
+            ipaddress=camera.ipaddress,
+            netmask=camera.netmask,
+            gateway=camera.gateway,
+            device_name=camera.device_name,
+            device_location=camera.device_location,
+            created_at=camera.created_at,
+            updated_at=camera.updated_at,
+        )
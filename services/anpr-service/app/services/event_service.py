@@ -3,12 +3,19 @@ Event service layer.
 """
 from __future__ import annotations
 
+import tempfile
+from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Row, Select, and_, bindparam, insert, or_, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.camera_cache import camera_id_cache
+from app.core.database import get_bulk_load_engine
 from app.models import (
     AttributeEvent,
     Camera,
@@ -18,12 +25,111 @@ from app.models import (
     ViolationEvent,
 )
 from app.schemas import (
+    LprEventBulkResult,
     LprEventCreate,
     LprEventList,
+    LprEventListAdapter,
     LprEventRead,
 )
 
 
+# MySQL error code for a unique key violation (ER_DUP_ENTRY).
+_ER_DUP_ENTRY = 1062
+
+# Rows written per transaction by the bulk ingest path.
+BULK_INSERT_BATCH_SIZE = 1000
+
+# Rows per LOAD DATA statement in the backfill path.
+COPY_BATCH_SIZE = 10000
+
+# Rows fetched per round trip when streaming an export.
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = (
+    "id",
+    "camera_id",
+    "event_type",
+    "event_uid",
+    "event_time",
+    "plate_number",
+    "device_name",
+    "matched_list",
+    "violation_type",
+    "speed",
+    "confidence",
+    "image_url",
+)
+
+# lpr_events columns read by LprEventList and the CSV export.
+_LIST_COLUMNS = tuple(getattr(LprEvent, name) for name in EXPORT_COLUMNS)
+
+# (child model, LprEventCreate attribute)
+_CHILD_MODELS = (
+    (ListEvent, "list_event"),
+    (AttributeEvent, "attribute_event"),
+    (ViolationEvent, "violation_event"),
+    (VehicleCountingEvent, "vehicle_counting"),
+)
+
+# Child relationships are lazy="raise" on the model; single-event reads opt
+# in to loading all four with one IN query each.
+_EVENT_DETAIL_LOADS = (
+    selectinload(LprEvent.list_event),
+    selectinload(LprEvent.attribute_event),
+    selectinload(LprEvent.violation_event),
+    selectinload(LprEvent.vehicle_counting_event),
+)
+
+
+# InnoDB's default ngram_token_size; shorter terms cannot be answered by the
+# FULLTEXT index.
+PLATE_NGRAM_SIZE = 2
+
+
+def _plate_number_filter(plate_number: str) -> Any:
+    """Case-insensitive partial match on ``plate_number``."""
+    term = plate_number.replace('"', "")
+    if len(term) < PLATE_NGRAM_SIZE:
+        # The utf8mb4 collation already compares case-insensitively;
+        # ilike() would wrap the column in lower() and defeat the index.
+        return LprEvent.plate_number.like(f"%{plate_number}%")
+    # A quoted phrase makes the ngrams of the term match adjacently, i.e. as
+    # a substring of the plate, using ft_lpr_events_plate_number.
+    return match(LprEvent.plate_number, against=f'"{term}"').in_boolean_mode()
+
+
+# Camera prefetch filters by bound-parameter name; each is an expanding IN
+# so one statement serves any number of values.
+_CAMERA_LOOKUP_CLAUSES = (
+    ("camera_ids", Camera.id.in_(bindparam("camera_ids", expanding=True))),
+    ("device_ips", Camera.ipaddress.in_(bindparam("device_ips", expanding=True))),
+    ("device_names", Camera.device_name.in_(bindparam("device_names", expanding=True))),
+)
+
+
+@lru_cache(maxsize=None)
+def _camera_lookup_stmt(params: Tuple[str, ...]) -> Select:
+    """Prefetch statement OR-ing the lookups named in ``params``, built once per shape."""
+    clauses = [clause for name, clause in _CAMERA_LOOKUP_CLAUSES if name in params]
+    return select(Camera.id, Camera.ipaddress, Camera.device_name).where(or_(*clauses))
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _is_duplicate_event_uid(exc: IntegrityError) -> bool:
+    """Whether ``exc`` is a unique key violation on ``lpr_events.event_uid``."""
+    args = getattr(exc.orig, "args", ())
+    return len(args) >= 2 and args[0] == _ER_DUP_ENTRY and "event_uid" in str(args[1])
+
+
 class CameraNotFoundError(Exception):
     """Raised when a camera matching the event payload cannot be located."""
 
@@ -31,6 +137,14 @@ class CameraNotFoundError(Exception):
         super().__init__(message)
 
 
+class _CameraIndex(NamedTuple):
+    """Camera lookups prefetched for a batch of event payloads."""
+
+    ids: Set[int]
+    by_ip: Dict[str, int]
+    by_name: Dict[str, int]
+
+
 class EventService:
     """
     Business logic for LPR events.
@@ -49,96 +163,106 @@ class EventService:
                 "Unable to resolve camera from payload. Ensure the camera is registered and the IP address matches."
             )
 
-        # Mutate payload so downstream consumers observe the resolved camera id
-        payload.camera_id = camera_id
-        device = payload.device_info
-        event_info = payload.event_info
-        plate = payload.plate_info
+        # A retransmitted event_uid returns the stored event. Only that unique
+        # key is treated as a duplicate: truncation, NOT NULL and foreign key
+        # errors still fail the request.
+        row = self._event_row(payload, camera_id)
+        try:
+            result = self.db.execute(insert(LprEvent).values(**row))
+        except IntegrityError as exc:
+            self.db.rollback()
+            if not _is_duplicate_event_uid(exc):
+                raise
+            return self._get_event_by_uid(row["event_uid"])
+
+        event_id = result.inserted_primary_key[0]
+        for model, child_row in self._child_rows(payload).items():
+            self.db.execute(insert(model).values(event_id=event_id, **child_row))
+
+        # Everything but the server-side timestamps is already in the payload,
+        # so skip re-reading the event and its four child tables.
+        created_at, updated_at = self.db.execute(
+            select(LprEvent.created_at, LprEvent.updated_at).where(LprEvent.id == event_id)
+        ).one()
+        self.db.commit()
 
-        event = LprEvent(
-            camera_id=camera_id,
-            device_name=device.device_name,
-            device_ip=device.device_ip,
-            device_model=device.device_model,
-            device_firmware_version=device.firmware_version,
-            event_type=event_info.event_type,
-            event_uid=event_info.event_id,
-            event_time=event_info.event_time,
-            event_description=event_info.event_description,
-            plate_number=plate.plate_number,
-            plate_color=plate.plate_color,
-            vehicle_color=plate.vehicle_color,
-            vehicle_type=plate.vehicle_type,
-            vehicle_brand=plate.brand,
-            travel_direction=plate.direction,
-            speed=plate.speed,
-            confidence=plate.confidence,
-            image_url=plate.image_url,
-            plate_roi_x=plate.plate_roi.x if plate.plate_roi else None,
-            plate_roi_y=plate.plate_roi.y if plate.plate_roi else None,
-            plate_roi_width=plate.plate_roi.width if plate.plate_roi else None,
-            plate_roi_height=plate.plate_roi.height if plate.plate_roi else None,
+        return LprEventRead.model_validate(
+            {
+                "id": event_id,
+                "camera_id": camera_id,
+                "device_info": payload.device_info,
+                "event_info": payload.event_info,
+                "plate_info": payload.plate_info,
+                "list_event": payload.list_event,
+                "attribute_event": payload.attribute_event,
+                "violation_event": payload.violation_event,
+                "vehicle_counting": payload.vehicle_counting,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
         )
 
-        if payload.list_event:
-            event.list_event = ListEvent(
-                matched_list=payload.list_event.matched_list,
-                list_id=payload.list_event.list_id,
-                matched_by=payload.list_event.matched_by,
-                confidence=payload.list_event.confidence,
-                description=payload.list_event.description,
-            )
-
-        if payload.attribute_event:
-            event.attribute_event = AttributeEvent(
-                vehicle_presence=payload.attribute_event.vehicle_presence,
-                vehicle_make=payload.attribute_event.vehicle_make,
-                vehicle_color=payload.attribute_event.vehicle_color,
-                vehicle_size=payload.attribute_event.vehicle_size,
-                vehicle_direction=payload.attribute_event.vehicle_direction,
-            )
-
-        if payload.violation_event:
-            event.violation_event = ViolationEvent(
-                violation_type=payload.violation_event.violation_type,
-                speed_limit=payload.violation_event.speed_limit,
-                measured_speed=payload.violation_event.measured_speed,
-                violation_status=payload.violation_event.violation_status,
-                violation_image=payload.violation_event.violation_image,
-            )
-
-        if payload.vehicle_counting:
-            event.vehicle_counting_event = VehicleCountingEvent(
-                lane_id=payload.vehicle_counting.lane_id,
-                counting_region=payload.vehicle_counting.counting_region,
-                count_in=payload.vehicle_counting.count_in,
-                count_out=payload.vehicle_counting.count_out,
-                current_count=payload.vehicle_counting.current_count,
-            )
-
-        self.db.add(event)
-        self.db.commit()
-        self.db.refresh(event)
-
-        return self._to_read_schema(event)
+    def create_events_bulk(self, payloads: List[LprEventCreate]) -> LprEventBulkResult:
+        """
+        Insert many events with one statement per table per batch.
+
+        Each batch of ``BULK_INSERT_BATCH_SIZE`` payloads is committed on its
+        own, so batches preceding a failing one stay persisted. Events whose
+        ``event_uid`` is already stored (or repeated within the batch) are
+        skipped; their existing ids are still returned but they do not count
+        towards ``created``. An event stored concurrently between the lookup
+        and the insert fails its batch, which is safe to retry.
+        """
+        created = 0
+        event_ids: List[int] = []
+        for start in range(0, len(payloads), BULK_INSERT_BATCH_SIZE):
+            batch = payloads[start:start + BULK_INSERT_BATCH_SIZE]
+            batch_created, batch_ids = self._insert_event_batch(batch)
+            created += batch_created
+            event_ids.extend(batch_ids)
+        return LprEventBulkResult(created=created, event_ids=event_ids)
+
+    def copy_events(self, payloads: Iterable[LprEventCreate]) -> LprEventBulkResult:
+        """
+        Backfill events with ``LOAD DATA LOCAL INFILE``.
+
+        Meant for trusted, offline re-ingest (see ``scripts/backfill_events.py``):
+        ``lpr_events`` rows are streamed from a temporary file in chunks of
+        ``COPY_BATCH_SIZE`` with foreign key checks disabled, then child rows
+        are written with multi-row inserts. Duplicated ``event_uid`` values are
+        skipped as in ``create_events_bulk``.
+        """
+        created = 0
+        event_ids: List[int] = []
+        for batch in _chunked(payloads, COPY_BATCH_SIZE):
+            rows = self._resolve_event_rows(batch)
+            uids = [row["event_uid"] for row in rows]
+            existing = self._existing_event_uids(uids)
+            new_rows = self._new_event_rows(rows, existing)
+            if new_rows:
+                created += self._load_event_rows(new_rows)
+            # End the read snapshot opened by the camera prefetch so the rows
+            # loaded on the other connection are visible.
+            self.db.commit()
+            event_ids.extend(self._insert_child_rows(batch, uids, existing))
+            self.db.commit()
+        return LprEventBulkResult(created=created, event_ids=event_ids)
 
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
     def get_event(self, event_id: int) -> Optional[LprEventRead]:
-        event = (
-            self.db.query(LprEvent)
-            .options(
-                joinedload(LprEvent.list_event),
-                joinedload(LprEvent.attribute_event),
-                joinedload(LprEvent.violation_event),
-                joinedload(LprEvent.vehicle_counting_event),
-            )
-            .filter(LprEvent.id == event_id)
-            .first()
-        )
+        event = self.db.execute(
+            select(LprEvent).options(*_EVENT_DETAIL_LOADS).where(LprEvent.id == event_id)
+        ).scalar_one_or_none()
         return self._to_read_schema(event) if event else None
 
+    def _get_event_by_uid(self, event_uid: str) -> LprEventRead:
+        event = self.db.execute(
+            select(LprEvent).options(*_EVENT_DETAIL_LOADS).where(LprEvent.event_uid == event_uid)
+        ).scalar_one()
+        return self._to_read_schema(event)
+
     def list_events(
         self,
         *,
@@ -149,23 +273,106 @@ class EventService:
         end_time: Optional[datetime] = None,
         matched_list: Optional[str] = None,
         violation_type: Optional[str] = None,
+        after_time: Optional[datetime] = None,
+        after_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
     ) -> List[LprEventList]:
-        stmt = (
-            select(LprEvent)
-            .outerjoin(ListEvent)
-            .outerjoin(ViolationEvent)
-            .options(
-                joinedload(LprEvent.list_event),
-                joinedload(LprEvent.violation_event),
+        """
+        List events newest first.
+
+        Pass the ``event_time``/``id`` of the last row of the previous page as
+        ``after_time``/``after_id`` to page without OFFSET; ``skip`` is kept
+        for existing clients.
+        """
+        # Listings only read lpr_events columns (matched_list/violation_type
+        # are denormalized onto it), so select just those as plain rows.
+        stmt = select(*_LIST_COLUMNS)
+
+        stmt = self._apply_filters(
+            stmt,
+            camera_id=camera_id,
+            plate_number=plate_number,
+            event_type=event_type,
+            start_time=start_time,
+            end_time=end_time,
+            matched_list=matched_list,
+            violation_type=violation_type,
+        )
+
+        if after_time is not None and after_id is not None:
+            # Expanded form of (event_time, id) < (after_time, after_id) so
+            # MySQL can range-scan ix_lpr_events_event_time_desc.
+            stmt = stmt.where(
+                or_(
+                    LprEvent.event_time < after_time,
+                    and_(LprEvent.event_time == after_time, LprEvent.id < after_id),
+                )
             )
+
+        stmt = stmt.order_by(LprEvent.event_time.desc(), LprEvent.id.desc())
+        if skip:
+            stmt = stmt.offset(skip)
+        stmt = stmt.limit(limit)
+
+        rows = self.db.execute(stmt).all()
+        # Validate the whole page in one pydantic-core call, reading the row
+        # attributes directly.
+        return LprEventListAdapter.validate_python(rows, from_attributes=True)
+
+    def export_events(
+        self,
+        *,
+        camera_id: Optional[int] = None,
+        plate_number: Optional[str] = None,
+        event_type: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        matched_list: Optional[str] = None,
+        violation_type: Optional[str] = None,
+    ) -> Iterator[Row]:
+        """
+        Stream every matching event as a flat row (columns ``EXPORT_COLUMNS``).
+
+        Rows are read through a server-side cursor ``EXPORT_BATCH_SIZE`` at a
+        time, so memory stays bounded however many events match.
+        """
+        stmt = select(*_LIST_COLUMNS)
+        stmt = self._apply_filters(
+            stmt,
+            camera_id=camera_id,
+            plate_number=plate_number,
+            event_type=event_type,
+            start_time=start_time,
+            end_time=end_time,
+            matched_list=matched_list,
+            violation_type=violation_type,
         )
+        stmt = stmt.order_by(LprEvent.event_time.desc(), LprEvent.id.desc()).execution_options(
+            stream_results=True, yield_per=EXPORT_BATCH_SIZE
+        )
+
+        yield from self.db.execute(stmt)
 
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _apply_filters(
+        stmt: Select,
+        *,
+        camera_id: Optional[int] = None,
+        plate_number: Optional[str] = None,
+        event_type: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        matched_list: Optional[str] = None,
+        violation_type: Optional[str] = None,
+    ) -> Select:
         if camera_id is not None:
             stmt = stmt.where(LprEvent.camera_id == camera_id)
         if plate_number:
-            stmt = stmt.where(LprEvent.plate_number.ilike(f"%{plate_number}%"))
+            stmt = stmt.where(_plate_number_filter(plate_number))
         if event_type:
             stmt = stmt.where(LprEvent.event_type == event_type)
         if start_time:
@@ -173,63 +380,269 @@ class EventService:
         if end_time:
             stmt = stmt.where(LprEvent.event_time <= end_time)
         if matched_list:
-            stmt = stmt.where(ListEvent.matched_list == matched_list)
+            stmt = stmt.where(LprEvent.matched_list == matched_list)
         if violation_type:
-            stmt = stmt.where(ViolationEvent.violation_type == violation_type)
+            stmt = stmt.where(LprEvent.violation_type == violation_type)
+        return stmt
+
+    def _insert_event_batch(self, payloads: List[LprEventCreate]) -> Tuple[int, List[int]]:
+        rows = self._resolve_event_rows(payloads)
+        uids = [row["event_uid"] for row in rows]
+        # Look the batch's uids up once rather than using INSERT IGNORE, which
+        # would also downgrade truncation and constraint errors to warnings.
+        existing = self._existing_event_uids(uids)
+        new_rows = self._new_event_rows(rows, existing)
+        if new_rows:
+            self.db.execute(insert(LprEvent), new_rows)
+        event_ids = self._insert_child_rows(payloads, uids, existing)
+        self.db.commit()
+        return len(new_rows), event_ids
 
-        stmt = stmt.order_by(LprEvent.event_time.desc()).offset(skip).limit(limit)
+    def _existing_event_uids(self, uids: List[str]) -> Set[str]:
+        return set(
+            self.db.execute(
+                select(LprEvent.event_uid).where(LprEvent.event_uid.in_(uids))
+            ).scalars()
+        )
+
+    @staticmethod
+    def _new_event_rows(rows: List[Dict[str, Any]], existing: Set[str]) -> List[Dict[str, Any]]:
+        """Rows whose uid is not stored yet, keeping the first of any repeats."""
+        seen = set(existing)
+        new_rows = []
+        for row in rows:
+            if row["event_uid"] not in seen:
+                seen.add(row["event_uid"])
+                new_rows.append(row)
+        return new_rows
+
+    def _resolve_event_rows(self, payloads: List[LprEventCreate]) -> List[Dict[str, Any]]:
+        index = self._prefetch_cameras(payloads)
+
+        rows: List[Dict[str, Any]] = []
+        for payload in payloads:
+            camera_id = self._resolve_camera_id_from_index(payload, index)
+            if camera_id is None:
+                raise CameraNotFoundError(
+                    f"Unable to resolve camera for event {payload.event_info.event_id}. "
+                    "Ensure the camera is registered and the IP address matches."
+                )
+            rows.append(self._event_row(payload, camera_id))
+        return rows
+
+    def _insert_child_rows(
+        self, payloads: List[LprEventCreate], uids: List[str], existing: Set[str]
+    ) -> List[int]:
+        # MySQL has no INSERT ... RETURNING; read the generated ids back by the
+        # unique event uid in a single round trip instead.
+        id_by_uid = dict(
+            self.db.execute(
+                select(LprEvent.event_uid, LprEvent.id).where(LprEvent.event_uid.in_(uids))
+            ).all()
+        )
 
-        events = self.db.execute(stmt).scalars().unique().all()
-        return [self._to_list_schema(event) for event in events]
+        # Children of events stored before this batch already exist; repeats
+        # within the batch keep the children of their first occurrence.
+        written = set(existing)
+        child_rows: Dict[type, List[Dict[str, Any]]] = defaultdict(list)
+        for payload, uid in zip(payloads, uids):
+            if uid in written:
+                continue
+            written.add(uid)
+            event_id = id_by_uid[uid]
+            for model, row in self._child_rows(payload).items():
+                child_rows[model].append({"event_id": event_id, **row})
+
+        for model, model_rows in child_rows.items():
+            self.db.execute(insert(model), model_rows)
+
+        return [id_by_uid[uid] for uid in uids]
+
+    def _load_event_rows(self, rows: List[Dict[str, Any]]) -> int:
+        columns = list(rows[0])
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".tsv") as handle:
+            for row in rows:
+                handle.write("\t".join(self._load_data_field(row[column]) for column in columns))
+                handle.write("\n")
+            handle.flush()
+
+            with get_bulk_load_engine().begin() as connection:
+                # Camera ids were just resolved against anpr_cameras, so the
+                # foreign key check is redundant for this load.
+                connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 0")
+                try:
+                    result = connection.exec_driver_sql(
+                        "LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE lpr_events "
+                        "CHARACTER SET utf8mb4 "
+                        "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                        "LINES TERMINATED BY '\\n' "
+                        f"({', '.join(columns)})",
+                        (handle.name,),
+                    )
+                finally:
+                    connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 1")
+        return result.rowcount
 
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
-    def _resolve_camera_id(self, payload: LprEventCreate) -> Optional[int]:
-        if payload.camera_id:
-            candidate_id = payload.camera_id
-            if candidate_id > 0:
-                camera = self.db.get(Camera, candidate_id)
-                if camera:
-                    return camera.id
-
-        # Attempt lookup via IP address
-        device_ip = payload.device_info.device_ip if payload.device_info else None
-        if device_ip:
-            stmt = select(Camera).where(Camera.ipaddress == device_ip)
-            camera = self.db.execute(stmt).scalar_one_or_none()
-            if camera:
-                return camera.id
-
-        # Attempt lookup by device name
-        if payload.device_info and payload.device_info.device_name:
-            stmt = select(Camera).where(Camera.device_name == payload.device_info.device_name)
-            camera = self.db.execute(stmt).scalar_one_or_none()
-            if camera:
-                return camera.id
+    @staticmethod
+    def _load_data_field(value: Any) -> str:
+        """Encode a value for LOAD DATA with the default backslash escaping."""
+        if value is None:
+            return "\\N"
+        if isinstance(value, datetime):
+            # Same wall-clock format pymysql sends for regular inserts.
+            return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+        text = str(value)
+        return (
+            text.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+            .replace("\0", "\\0")
+        )
+
+    def _prefetch_cameras(self, payloads: List[LprEventCreate]) -> _CameraIndex:
+        candidate_ids = {
+            payload.camera_id for payload in payloads if payload.camera_id and payload.camera_id > 0
+        }
+        device_ips = {
+            payload.device_info.device_ip
+            for payload in payloads
+            if payload.device_info and payload.device_info.device_ip
+        }
+        device_names = {
+            payload.device_info.device_name
+            for payload in payloads
+            if payload.device_info and payload.device_info.device_name
+        }
+
+        params = {
+            name: list(values)
+            for name, values in (
+                ("camera_ids", candidate_ids),
+                ("device_ips", device_ips),
+                ("device_names", device_names),
+            )
+            if values
+        }
+        if not params:
+            return _CameraIndex(set(), {}, {})
+
+        stmt = _camera_lookup_stmt(tuple(params))
+        index = _CameraIndex(set(), {}, {})
+        for camera_id, ipaddress, device_name in self.db.execute(stmt, params).all():
+            index.ids.add(camera_id)
+            if ipaddress:
+                index.by_ip[ipaddress] = camera_id
+            if device_name:
+                index.by_name.setdefault(device_name, camera_id)
+        return index
+
+    @staticmethod
+    def _resolve_camera_id_from_index(
+        payload: LprEventCreate, index: _CameraIndex
+    ) -> Optional[int]:
+        if payload.camera_id and payload.camera_id in index.ids:
+            return payload.camera_id
+
+        device = payload.device_info
+        if device and device.device_ip and device.device_ip in index.by_ip:
+            return index.by_ip[device.device_ip]
+        if device and device.device_name and device.device_name in index.by_name:
+            return index.by_name[device.device_name]
 
         return None
 
+    @staticmethod
+    def _event_row(payload: LprEventCreate, camera_id: int) -> Dict[str, Any]:
+        device = payload.device_info
+        event_info = payload.event_info
+        plate = payload.plate_info
+        roi = plate.plate_roi
+
+        return {
+            "camera_id": camera_id,
+            "device_name": device.device_name,
+            "device_ip": device.device_ip,
+            "device_model": device.device_model,
+            "device_firmware_version": device.firmware_version,
+            "event_type": event_info.event_type,
+            "event_uid": event_info.event_id,
+            "event_time": event_info.event_time,
+            "event_description": event_info.event_description,
+            "plate_number": plate.plate_number,
+            "plate_color": plate.plate_color,
+            "vehicle_color": plate.vehicle_color,
+            "vehicle_type": plate.vehicle_type,
+            "vehicle_brand": plate.brand,
+            "travel_direction": plate.direction,
+            "speed": plate.speed,
+            "confidence": plate.confidence,
+            "image_url": plate.image_url,
+            "plate_roi_x": roi["x"] if roi else None,
+            "plate_roi_y": roi["y"] if roi else None,
+            "plate_roi_width": roi["width"] if roi else None,
+            "plate_roi_height": roi["height"] if roi else None,
+            # Denormalized from the child payloads for join-free listing.
+            "matched_list": payload.list_event.matched_list if payload.list_event else None,
+            "violation_type": (
+                payload.violation_event.violation_type if payload.violation_event else None
+            ),
+        }
+
+    @staticmethod
+    def _child_rows(payload: LprEventCreate) -> Dict[type, Dict[str, Any]]:
+        """Column values for each child table present in the payload."""
+        rows: Dict[type, Dict[str, Any]] = {}
+        for model, payload_attr in _CHILD_MODELS:
+            schema = getattr(payload, payload_attr)
+            if schema is not None:
+                rows[model] = schema.model_dump(by_alias=False)
+        return rows
+
+    def _resolve_camera_id(self, payload: LprEventCreate) -> Optional[int]:
+        # Lookups in priority order (id, ip, name); hits are cached per process
+        # so repeated posts from the same device skip the round trip.
+        cache_keys = []
+        if payload.camera_id and payload.camera_id > 0:
+            cache_keys.append(("id", payload.camera_id))
+        device = payload.device_info
+        if device and device.device_ip:
+            cache_keys.append(("ip", device.device_ip))
+        if device and device.device_name:
+            cache_keys.append(("name", device.device_name))
+
+        if not cache_keys:
+            return None
+
+        # A hit on the highest-priority key is authoritative; on a miss all
+        # candidates are resolved with one OR-ed query rather than one
+        # SELECT per key.
+        camera_id = camera_id_cache.get(cache_keys[0])
+        if camera_id is not None:
+            return camera_id
+
+        index = self._prefetch_cameras([payload])
+        for kind, value in cache_keys:
+            if kind == "id":
+                camera_id = value if value in index.ids else None
+            elif kind == "ip":
+                camera_id = index.by_ip.get(value)
+            else:
+                camera_id = index.by_name.get(value)
+            if camera_id is not None:
+                camera_id_cache.set((kind, value), camera_id)
+
+        return self._resolve_camera_id_from_index(payload, index)
+
     def _to_read_schema(self, event: Optional[LprEvent]) -> Optional[LprEventRead]:
         if not event:
             return None
 
+        x, y = event.plate_roi_x, event.plate_roi_y
+        width, height = event.plate_roi_width, event.plate_roi_height
         plate_roi = None
-        if all(
-            value is not None
-            for value in (
-                event.plate_roi_x,
-                event.plate_roi_y,
-                event.plate_roi_width,
-                event.plate_roi_height,
-            )
-        ):
-            plate_roi = {
-                "x": event.plate_roi_x,
-                "y": event.plate_roi_y,
-                "width": event.plate_roi_width,
-                "height": event.plate_roi_height,
-            }
+        if x is not None and y is not None and width is not None and height is not None:
+            plate_roi = {"x": x, "y": y, "width": width, "height": height}
 
         payload = {
             "id": event.id,
@@ -258,85 +671,14 @@ class EventService:
                 "image_url": event.image_url,
                 "plate_roi": plate_roi,
             },
-            "list_event": self._to_list_event_schema(event.list_event),
-            "attribute_event": self._to_attribute_schema(event.attribute_event),
-            "violation_event": self._to_violation_schema(event.violation_event),
-            "vehicle_counting": self._to_vehicle_counting_schema(event.vehicle_counting_event),
+            # Child schemas mirror their tables column for column, so the ORM
+            # instances are validated by attribute without an interim dict.
+            "list_event": event.list_event,
+            "attribute_event": event.attribute_event,
+            "violation_event": event.violation_event,
+            "vehicle_counting": event.vehicle_counting_event,
             "created_at": event.created_at,
             "updated_at": event.updated_at,
         }
 
-        return LprEventRead.model_validate(payload)
-
-    def _to_list_schema(self, event: LprEvent) -> LprEventList:
-        list_event = event.list_event
-        violation = event.violation_event
-
-        payload = {
-            "id": event.id,
-            "camera_id": event.camera_id,
-            "event_type": event.event_type,
-            "event_uid": event.event_uid,
-            "event_time": event.event_time,
-            "plate_number": event.plate_number,
-            "device_name": event.device_name,
-            "matched_list": list_event.matched_list if list_event else None,
-            "violation_type": violation.violation_type if violation else None,
-            "speed": event.speed,
-            "confidence": event.confidence,
-            "image_url": event.image_url,
-        }
-
-        return LprEventList.model_validate(payload)
-
-    @staticmethod
-    def _to_list_event_schema(list_event: Optional[ListEvent]) -> Optional[dict]:
-        if not list_event:
-            return None
-        return {
-            "matched_list": list_event.matched_list,
-            "list_id": list_event.list_id,
-            "matched_by": list_event.matched_by,
-            "confidence": list_event.confidence,
-            "description": list_event.description,
-        }
-
-    @staticmethod
-    def _to_attribute_schema(attribute_event: Optional[AttributeEvent]) -> Optional[dict]:
-        if not attribute_event:
-            return None
-        return {
-            "vehicle_presence": attribute_event.vehicle_presence,
-            "vehicle_make": attribute_event.vehicle_make,
-            "vehicle_color": attribute_event.vehicle_color,
-            "vehicle_size": attribute_event.vehicle_size,
-            "vehicle_direction": attribute_event.vehicle_direction,
-        }
-
-    @staticmethod
-    def _to_violation_schema(violation_event: Optional[ViolationEvent]) -> Optional[dict]:
-        if not violation_event:
-            return None
-        return {
-            "violation_type": violation_event.violation_type,
-            "speed_limit": violation_event.speed_limit,
-            "measured_speed": violation_event.measured_speed,
-            "violation_status": violation_event.violation_status,
-            "violation_image": violation_event.violation_image,
-        }
-
-    @staticmethod
-    def _to_vehicle_counting_schema(
-        vehicle_counting_event: Optional[VehicleCountingEvent],
-    ) -> Optional[dict]:
-        if not vehicle_counting_event:
-            return None
-        return {
-            "lane_id": vehicle_counting_event.lane_id,
-            "counting_region": vehicle_counting_event.counting_region,
-            "count_in": vehicle_counting_event.count_in,
-            "count_out": vehicle_counting_event.count_out,
-            "current_count": vehicle_counting_event.current_count,
-        }
-
-
+        return LprEventRead.model_validate(payload, from_attributes=True)
@@ -10,5 +10,8 @@ echo "Skipping migrations (tables already created manually)..."
 
 echo "Starting ANPR service..."
 cd /app/services/anpr-service
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000
+# uvloop/httptools are pinned rather than auto-detected; the request logging
+# middleware already logs each request, so the access log is off.
+exec uvicorn app.main:app --host 0.0.0.0 --port 8000 \
+    --loop uvloop --http httptools --no-access-log
 
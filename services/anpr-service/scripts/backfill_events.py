@@ -0,0 +1,61 @@
+"""
+Backfill LPR events from a JSON export using LOAD DATA LOCAL INFILE.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Optional, Sequence
+
+# Ensure shared packages are importable when the script is executed directly
+current_dir = os.path.dirname(os.path.abspath(__file__))
+anpr_service_dir = os.path.dirname(current_dir)
+services_dir = os.path.dirname(anpr_service_dir)
+root_dir = os.path.dirname(services_dir)
+
+sys.path.insert(0, root_dir)
+sys.path.insert(0, anpr_service_dir)
+
+from pydantic import TypeAdapter
+
+from services.shared.database.session import SessionLocal
+from services.shared.utils.logger import setup_logger
+
+from app.schemas import LprEventCreate
+from app.services import EventService
+
+logger = setup_logger(__name__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Backfill LPR events into the ANPR database")
+    parser.add_argument(
+        "path",
+        help="JSON file holding an array of event payloads (same shape as POST /events)",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    with open(args.path, encoding="utf-8") as handle:
+        payloads = TypeAdapter(list[LprEventCreate]).validate_python(json.load(handle))
+
+    db = SessionLocal()
+    try:
+        result = EventService(db).copy_events(payloads)
+    finally:
+        db.close()
+
+    logger.info(
+        "Backfill complete: %s new events (%s payloads)",
+        result.created,
+        len(result.event_ids),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,10 +15,11 @@ auth_service_dir = os.path.dirname(current_dir)  # auth-service/
 services_dir = os.path.dirname(auth_service_dir)  # services/
 root_dir = os.path.dirname(services_dir)  # traffic-system-backend/
 
-# Add root directory to path so we can import 'services.shared'
-sys.path.insert(0, root_dir)
-# Also add auth-service directory so we can import 'app.models'
-sys.path.insert(0, auth_service_dir)
+# Add root directory to path so we can import 'services.shared', and the
+# auth-service directory so we can import 'app.models' (once each).
+for path in (root_dir, auth_service_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 # Import shared database base
 from services.shared.database.base import Base
@@ -84,15 +85,8 @@ else:
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Import all models here so Alembic can detect them
-from app.models.user import User
-from app.models.role import Role
-from app.models.permission import Permission
-from app.models.refresh_token import RefreshToken
-from app.models.user_role import UserRole
-from app.models.role_permission import RolePermission
-from app.models.service import Service
-from app.models.role_service_access import RoleServiceAccess
+# Importing the package registers every model on Base.metadata
+from app import models  # noqa: F401
 
 # Set target metadata for autogenerate
 target_metadata = Base.metadata
@@ -1,9 +1,15 @@
 """
 Authentication API routes
+
+Token refresh and logout only do I/O and run on the async engine through
+``AsyncSession.run_sync``; register and login hash or verify passwords and
+stay synchronous so that work happens in the threadpool. Authenticated
+routes share the sync session that loaded the current user.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from services.shared.database.session import get_db
+from services.shared.database.session import get_async_db, get_db
 from app.schemas.auth import (
     UserRegister,
     UserLogin,
@@ -20,12 +26,15 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(
+def register(
     user_data: UserRegister,
     db: Session = Depends(get_db)
 ):
     """
     Register a new user
+
+    Plain ``def``: password hashing is CPU-bound, so the handler runs in the
+    threadpool instead of stalling the event loop.
     """
     auth_service = AuthService(db)
     user = auth_service.register_user(user_data)
@@ -41,20 +50,22 @@ async def register(
         is_superuser=user.is_superuser,
         phone=user.phone,
         department=user.department,
-        roles=[role.name for role in user.roles],
+        roles=auth_service.get_role_names(user.id),
         created_at=user.created_at,
         updated_at=user.updated_at,
     )
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(
+def login(
     login_data: UserLogin,
     request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Login user and get access token
+
+    Plain ``def`` for the same reason as ``register`` (password verification).
     """
     auth_service = AuthService(db)
     
@@ -74,26 +85,27 @@ async def login(
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     refresh_data: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Refresh access token using refresh token
     """
-    auth_service = AuthService(db)
-    token_response = auth_service.refresh_access_token(refresh_data.refresh_token)
-    return token_response
+    return await db.run_sync(
+        lambda session: AuthService(session).refresh_access_token(refresh_data.refresh_token)
+    )
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
 async def logout(
     refresh_data: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Logout user by revoking refresh token
     """
-    auth_service = AuthService(db)
-    success = auth_service.logout(refresh_data.refresh_token)
+    success = await db.run_sync(
+        lambda session: AuthService(session).logout(refresh_data.refresh_token)
+    )
     
     if success:
         return {"message": "Successfully logged out"}
@@ -105,7 +117,7 @@ async def logout(
 
 
 @router.post("/logout-all", status_code=status.HTTP_200_OK)
-async def logout_all(
+def logout_all(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
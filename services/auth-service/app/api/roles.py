@@ -3,14 +3,19 @@ from __future__ import annotations
 
 from typing import List
 
-from fastapi import APIRouter, Depends, Query, status, Response
+from fastapi import APIRouter, Depends, Query, Request, status, Response
 from sqlalchemy.orm import Session
 
 from services.shared.database.session import get_db
 
 from app.dependencies.auth import require_superuser, require_admin_or_superuser
-from app.models.user import User
+from app.core.listing_cache import CachedListing, cached_listing
+from app.models import User
 from app.schemas import (
+    PERMISSION_LIST_ADAPTER,
+    PERMISSION_SUMMARY_LIST_ADAPTER,
+    ROLE_LIST_ADAPTER,
+    SERVICE_LIST_ADAPTER,
     PermissionCreate,
     PermissionRead,
     PermissionSummary,
@@ -26,6 +31,21 @@ from app.schemas import (
     ServiceUpdate,
 )
 from app.services import RoleManagementService
+from app.utils.etag import etag_matches
+
+
+def _listing_response(request: Request, listing: CachedListing) -> Response:
+    """
+    Serve a cached listing, or 304 when the client already has it.
+
+    The body is already serialized, so response_model is kept for the
+    OpenAPI schema only.
+    """
+    headers = {"ETag": listing.etag}
+    if etag_matches(request.headers.get("if-none-match"), listing.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(listing.body, media_type="application/json", headers=headers)
+
 
 role_router = APIRouter(prefix="/roles")
 service_router = APIRouter(prefix="/services")
@@ -35,26 +55,38 @@ permission_router = APIRouter(prefix="/permissions")
 @role_router.get("/", response_model=List[RoleListItem])
 def list_roles(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin_or_superuser),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
 ) -> List[RoleListItem]:
+    # Listings are identical for every admin and change rarely; see
+    # app.core.listing_cache for invalidation.
     service = RoleManagementService(db)
-    roles = service.list_roles(skip=skip, limit=limit)
-    return [RoleListItem.model_validate(role) for role in roles]
+    listing = cached_listing(
+        ("roles", skip, limit),
+        ROLE_LIST_ADAPTER,
+        lambda: service.list_roles(skip=skip, limit=limit),
+    )
+    return _listing_response(request, listing)
 
 
 @role_router.get("/permissions", response_model=List[PermissionSummary])
 def list_permissions(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin_or_superuser),
     include_inactive: bool = Query(default=False),
 ) -> List[PermissionSummary]:
     service = RoleManagementService(db)
-    permissions = service.list_permissions(include_inactive=include_inactive)
-    return [PermissionSummary.model_validate(permission) for permission in permissions]
+    listing = cached_listing(
+        ("permission_summaries", include_inactive),
+        PERMISSION_SUMMARY_LIST_ADAPTER,
+        lambda: service.list_permissions(include_inactive=include_inactive),
+    )
+    return _listing_response(request, listing)
 
 
 @role_router.post("/", response_model=RoleRead, status_code=status.HTTP_201_CREATED)
@@ -125,13 +157,18 @@ def update_role_service_access(
 @service_router.get("/", response_model=List[ServiceRead])
 def list_services(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_superuser),
     include_inactive: bool = Query(default=False),
 ) -> List[ServiceRead]:
     service = RoleManagementService(db)
-    services = service.list_services(include_inactive=include_inactive)
-    return [ServiceRead.model_validate(item) for item in services]
+    listing = cached_listing(
+        ("services", include_inactive),
+        SERVICE_LIST_ADAPTER,
+        lambda: service.list_services(include_inactive=include_inactive),
+    )
+    return _listing_response(request, listing)
 
 
 @service_router.post("/", response_model=ServiceRead, status_code=status.HTTP_201_CREATED)
@@ -189,6 +226,7 @@ def delete_service(
 @permission_router.get("/", response_model=List[PermissionRead])
 def list_all_permissions(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_superuser),
     include_inactive: bool = Query(default=False),
@@ -197,8 +235,12 @@ def list_all_permissions(
     List all permissions (super_admin only)
     """
     service = RoleManagementService(db)
-    permissions = service.list_permissions(include_inactive=include_inactive)
-    return [PermissionRead.model_validate(permission) for permission in permissions]
+    listing = cached_listing(
+        ("permissions", include_inactive),
+        PERMISSION_LIST_ADAPTER,
+        lambda: service.list_permissions(include_inactive=include_inactive),
+    )
+    return _listing_response(request, listing)
 
 
 @permission_router.post("/", response_model=PermissionRead, status_code=status.HTTP_201_CREATED)
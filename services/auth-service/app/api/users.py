@@ -2,13 +2,14 @@
 User management API routes
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from services.shared.database.session import get_db
 from app.schemas.auth import (
     UserUpdate,
     PasswordChange,
     UserResponse,
+    USER_LIST_ADAPTER,
     UserRolesUpdate,
     AdminUserUpdate,
 )
@@ -19,12 +20,13 @@ from app.dependencies.auth import (
     require_admin_or_superuser,
 )
 from app.models.user import User
+from app.utils.etag import compute_etag, etag_matches
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("", response_model=List[UserResponse])
-async def get_all_users(
+def get_all_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     current_user: User = Depends(require_admin_or_superuser),
@@ -35,51 +37,36 @@ async def get_all_users(
     """
     user_service = UserService(db)
     users = user_service.get_all_users(skip=skip, limit=limit)
-    
-    return [
-        UserResponse(
-            id=user.id,
-            email=user.email,
-            username=user.username,
-            full_name=user.full_name,
-            is_active=user.is_active,
-            is_verified=user.is_verified,
-            is_superuser=user.is_superuser,
-            phone=user.phone,
-            department=user.department,
-            roles=[role.name for role in user.roles],
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
-        for user in users
-    ]
+    # Validate and serialize the whole list in one pydantic-core pass;
+    # response_model is kept for the OpenAPI schema only.
+    return Response(
+        USER_LIST_ADAPTER.dump_json(USER_LIST_ADAPTER.validate_python(users, from_attributes=True)),
+        media_type="application/json",
+    )
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_my_profile(
+    request: Request,
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Get current user's profile
+
+    The ETag hashes the serialized profile itself: updated_at only has
+    second precision in MySQL, so two changes within a second would
+    otherwise share a tag.
     """
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        username=current_user.username,
-        full_name=current_user.full_name,
-        is_active=current_user.is_active,
-        is_verified=current_user.is_verified,
-        is_superuser=current_user.is_superuser,
-        phone=current_user.phone,
-        department=current_user.department,
-        roles=[role.name for role in current_user.roles],
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-    )
+    body = UserResponse.model_validate(current_user).model_dump_json().encode()
+    headers = {"ETag": compute_etag([body])}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # Already serialized; response_model is kept for the OpenAPI schema only.
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @router.patch("/me", response_model=UserResponse)
-async def update_my_profile(
+def update_my_profile(
     user_data: UserUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -90,24 +77,11 @@ async def update_my_profile(
     user_service = UserService(db)
     updated_user = user_service.update_user_profile(current_user, user_data)
     
-    return UserResponse(
-        id=updated_user.id,
-        email=updated_user.email,
-        username=updated_user.username,
-        full_name=updated_user.full_name,
-        is_active=updated_user.is_active,
-        is_verified=updated_user.is_verified,
-        is_superuser=updated_user.is_superuser,
-        phone=updated_user.phone,
-        department=updated_user.department,
-        roles=[role.name for role in updated_user.roles],
-        created_at=updated_user.created_at,
-        updated_at=updated_user.updated_at,
-    )
+    return updated_user
 
 
 @router.post("/me/change-password", status_code=status.HTTP_200_OK)
-async def change_my_password(
+def change_my_password(
     password_data: PasswordChange,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -121,7 +95,7 @@ async def change_my_password(
 
 
 @router.put("/{user_id}/roles", response_model=UserResponse)
-async def update_user_roles(
+def update_user_roles(
     user_id: int,
     role_data: UserRolesUpdate,
     current_user: User = Depends(require_permission("role:write")),
@@ -139,24 +113,11 @@ async def update_user_roles(
 
     updated_user = user_service.update_user_roles(user, role_data.roles, assigned_by=current_user.id)
 
-    return UserResponse(
-        id=updated_user.id,
-        email=updated_user.email,
-        username=updated_user.username,
-        full_name=updated_user.full_name,
-        is_active=updated_user.is_active,
-        is_verified=updated_user.is_verified,
-        is_superuser=updated_user.is_superuser,
-        phone=updated_user.phone,
-        department=updated_user.department,
-        roles=[role.name for role in updated_user.roles],
-        created_at=updated_user.created_at,
-        updated_at=updated_user.updated_at,
-    )
+    return updated_user
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
-async def admin_update_user(
+def admin_update_user(
     user_id: int,
     user_data: AdminUserUpdate,
     current_user: User = Depends(require_admin_or_superuser),
@@ -173,21 +134,6 @@ async def admin_update_user(
         )
 
     updated_user = user_service.admin_update_user(user, user_data, assigned_by=current_user.id)
-    # Reload roles to ensure response reflects latest state
-    updated_user = user_service.get_user_with_roles(updated_user.id)
-
-    return UserResponse(
-        id=updated_user.id,
-        email=updated_user.email,
-        username=updated_user.username,
-        full_name=updated_user.full_name,
-        is_active=updated_user.is_active,
-        is_verified=updated_user.is_verified,
-        is_superuser=updated_user.is_superuser,
-        phone=updated_user.phone,
-        department=updated_user.department,
-        roles=[role.name for role in updated_user.roles],
-        created_at=updated_user.created_at,
-        updated_at=updated_user.updated_at,
-    )
+
+    return updated_user
 
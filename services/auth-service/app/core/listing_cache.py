@@ -0,0 +1,44 @@
+"""
+In-process cache of the role, permission and service listings.
+"""
+from typing import Any, Callable, Hashable, Iterable, NamedTuple
+
+from pydantic import TypeAdapter
+
+from services.shared.cache import TTLCache, invalidate_after_commit
+
+from app.models import Permission, Role, Service
+from app.utils.etag import compute_etag
+
+
+class CachedListing(NamedTuple):
+    body: bytes
+    etag: str
+
+
+# Listing key (e.g. ``("roles", skip, limit)``) -> CachedListing.
+# The listings are the same for every admin, so the key holds only the
+# query parameters. Cleared when a transaction that wrote roles,
+# permissions or services commits in this process; the TTL bounds how long
+# other worker processes can serve an older listing.
+listing_cache = TTLCache(maxsize=256, ttl=30.0)
+
+
+def cached_listing(
+    key: Hashable, adapter: TypeAdapter, load: Callable[[], Iterable[Any]]
+) -> CachedListing:
+    """
+    Return the cached listing for ``key``. On a miss, the ORM rows from
+    ``load`` are validated and serialized by ``adapter`` in one pass.
+    """
+    listing = listing_cache.get(key)
+    if listing is None:
+        body = adapter.dump_json(adapter.validate_python(load(), from_attributes=True))
+        # The ETag is derived from the content once per fill, so it also
+        # changes when rows are deleted.
+        listing = CachedListing(body, compute_etag([body]))
+        listing_cache.set(key, listing)
+    return listing
+
+
+invalidate_after_commit((Role, Permission, Service), listing_cache.clear)
@@ -0,0 +1,43 @@
+"""
+In-process cache of verified access-token payloads.
+"""
+import hashlib
+import time
+from typing import Optional
+
+from services.shared.cache import TTLCache
+
+
+class AccessTokenCache:
+    """
+    Maps access tokens (by SHA-256 digest) to their decoded payloads, so a
+    client replaying the same token skips signature verification. Entries
+    expire ``ttl`` seconds after insert, or when the token itself expires if
+    that is sooner.
+
+    Only the decode is cached: callers still load the user on every request,
+    so deactivation and role changes apply immediately.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[dict]:
+        return self._cache.get(self._key(token))
+
+    def set(self, token: str, payload: dict) -> None:
+        ttl = None
+        token_exp = payload.get("exp")
+        if isinstance(token_exp, (int, float)):
+            ttl = token_exp - time.time()
+        self._cache.set(self._key(token), payload, ttl=ttl)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+access_token_cache = AccessTokenCache()
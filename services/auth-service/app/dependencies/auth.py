@@ -1,19 +1,26 @@
 """
 Authentication dependencies for FastAPI
 """
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, lazyload, selectinload
+from starlette.concurrency import run_in_threadpool
 from typing import Optional, List
 from datetime import datetime
 from services.shared.database.session import get_db
 from services.shared.utils import logging_context as log_ctx
+from app.core.token_cache import access_token_cache
+from app.models.role import Role
 from app.models.user import User
 from app.utils.security import decode_token
 from app.schemas.auth import TokenData
 
 security = HTTPBearer()
 
+# Either role grants admin access.
+_ADMIN_ROLES = frozenset({"admin", "super_admin"})
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -21,6 +28,12 @@ async def get_current_user(
 ) -> User:
     """
     Get current authenticated user from JWT token
+
+    The user is loaded on the request's sync session, which the route
+    handlers share, so a request holds one connection and the returned user
+    can be updated directly. The lookup runs in the threadpool to keep it
+    off the event loop, while this dependency stays async so the logging
+    context binding remains in the request.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -29,34 +42,56 @@ async def get_current_user(
     )
     
     token = credentials.credentials
-    payload = decode_token(token)
-    
+    # Dashboards send the same access token on every call; reuse the
+    # verified payload instead of checking the signature each time.
+    payload = access_token_cache.get(token)
     if payload is None:
-        raise credentials_exception
-    
-    # Check token type
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type"
-        )
+        payload = decode_token(token)
+        
+        if payload is None:
+            raise credentials_exception
+        
+        # Check token type
+        if payload.get("type") != "access":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token type"
+            )
+        
+        access_token_cache.set(token, payload)
     
     # Get user ID from token
-    user_id: str = payload.get("sub")
-    if user_id is None:
+    try:
+        user_id = int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
         raise credentials_exception
     
-    # Get user from database
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    # Get user from database. Role's own selectin relationships (users,
+    # services, access links) would otherwise fan out on every request;
+    # only role names and permissions are needed to authorize.
+    user = await run_in_threadpool(
+        db.get,
+        User,
+        user_id,
+        options=[
+            selectinload(User.roles).options(
+                selectinload(Role.permissions),
+                lazyload(Role.users),
+                lazyload(Role.services),
+                lazyload(Role.service_access_links),
+            )
+        ],
+    )
     if user is None:
         raise credentials_exception
 
-    roles = [role.name for role in getattr(user, "roles", [])]
+    # role_names is cached on the user, so the role guards that run next
+    # reuse the set built here.
     log_ctx.bind_user_context(
         user_id=str(user.id),
         username=user.username,
         email=user.email,
-        roles=roles,
+        roles=sorted(user.role_names),
     )
 
     return user
@@ -84,10 +119,14 @@ async def get_current_active_user(
     return current_user
 
 
+@lru_cache(maxsize=None)
 def require_permission(permission_name: str):
     """
     Dependency factory to require a specific permission
     Usage: @app.get("/endpoint", dependencies=[Depends(require_permission("users:read"))])
+
+    Repeated calls with the same name return the same checker, so FastAPI
+    resolves it once per request wherever it appears.
     """
     async def permission_checker(
         current_user: User = Depends(get_current_active_user)
@@ -102,10 +141,13 @@ def require_permission(permission_name: str):
     return permission_checker
 
 
+@lru_cache(maxsize=None)
 def require_role(role_name: str):
     """
     Dependency factory to require a specific role
     Usage: @app.get("/endpoint", dependencies=[Depends(require_role("admin"))])
+
+    Checkers are shared per role name, as with require_permission.
     """
     async def role_checker(
         current_user: User = Depends(get_current_active_user)
@@ -140,7 +182,7 @@ async def require_admin_or_superuser(
     """
     Require either admin or super_admin role
     """
-    if not (current_user.has_role("admin") or current_user.has_role("super_admin") or current_user.is_superuser):
+    if not (current_user.is_superuser or not _ADMIN_ROLES.isdisjoint(current_user.role_names)):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or super admin role required"
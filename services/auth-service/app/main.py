@@ -4,14 +4,15 @@ Serves both API endpoints and frontend static files
 """
 import os
 from pathlib import Path
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from services.shared.config.settings import settings
-from services.shared.middleware import configure_request_logging
+from services.shared.middleware import HealthCheckMiddleware, configure_request_logging
 from services.shared.utils.logger import setup_logger
 from app.api import auth, users, roles
+from app.utils.etag import compute_etag, etag_matches
 
 logger = setup_logger(__name__)
 
@@ -21,6 +22,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Request logging middleware (must be registered before other middleware)
@@ -37,10 +39,15 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=settings.CORS_EXPOSE_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
 )
 
+# Health probes (added last, so outermost) skip the middleware above
+app.add_middleware(HealthCheckMiddleware, service_name="auth-service")
+
 # Include API routers
 # API_V1_PREFIX already includes /api/v1
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX, tags=["Authentication"])
@@ -64,36 +71,62 @@ async def api_root():
 
 # Mount frontend static files
 frontend_dist = Path("/app/frontend/dist")
-if frontend_dist.exists():
-    # Mount static assets (JS, CSS, images, etc.)
-    app.mount("/assets", StaticFiles(directory=str(frontend_dist / "assets")), name="assets")
+if settings.SERVE_FRONTEND and frontend_dist.exists():
+    class ImmutableStaticFiles(StaticFiles):
+        """Static files whose names are content-hashed by the frontend build."""
+
+        def file_response(self, *args, **kwargs):
+            response = super().file_response(*args, **kwargs)
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+            return response
+
+    # Mount static assets (JS, CSS, images, etc.). Vite fingerprints every
+    # file under assets/, so browsers may keep them for good and never
+    # re-request them.
+    app.mount("/assets", ImmutableStaticFiles(directory=str(frontend_dist / "assets")), name="assets")
     
+    # The build is immutable for the life of the container: index the files
+    # (with their stat results) and read index.html once, instead of
+    # stat-ing the filesystem on every SPA navigation.
+    _frontend_files = {
+        path.relative_to(frontend_dist).as_posix(): (path, path.stat())
+        for path in frontend_dist.rglob("*")
+        if path.is_file()
+    }
+    _index_path = frontend_dist / "index.html"
+    _index_html = _index_path.read_bytes() if _index_path.is_file() else None
+    _index_etag = compute_etag([_index_html]) if _index_html else None
+
     @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
+    async def serve_frontend(full_path: str, request: Request):
         """
         Serve frontend static files and handle SPA routing.
         For any non-API route, serve index.html to support React Router.
         """
         # Skip API routes - they should be handled by API routers
-        if full_path.startswith("api/") or full_path == "health":
+        if full_path.startswith("api/"):
             # This shouldn't be reached if routes are properly registered
             # But if it is, return 404 instead of serving HTML
             from fastapi import HTTPException
             raise HTTPException(status_code=404, detail="Not found")
         
         # If requesting a specific file that exists, serve it
-        file_path = frontend_dist / full_path
-        if file_path.is_file():
-            return FileResponse(file_path)
+        frontend_file = _frontend_files.get(full_path)
+        if frontend_file is not None and full_path != "index.html":
+            file_path, stat_result = frontend_file
+            return FileResponse(file_path, stat_result=stat_result)
         
         # For all other routes (SPA routing), serve index.html
-        index_path = frontend_dist / "index.html"
-        if index_path.exists():
-            return FileResponse(index_path)
+        if _index_html is not None:
+            headers = {"ETag": _index_etag, "Cache-Control": "no-cache"}
+            if etag_matches(request.headers.get("if-none-match"), _index_etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=_index_html, media_type="text/html", headers=headers)
         
         return {"error": "Frontend not found"}
 else:
-    logger.warning("Frontend dist directory not found. Frontend will not be served.")
+    if settings.SERVE_FRONTEND:
+        logger.warning("Frontend dist directory not found. Frontend will not be served.")
     
     @app.get("/")
     async def root():
@@ -108,5 +141,13 @@ else:
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        access_log=False,
+    )
 
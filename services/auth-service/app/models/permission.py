@@ -17,11 +17,14 @@ class Permission(BaseModel):
     is_active = Column(Boolean, default=True, nullable=False)
 
     # Relationships
+    # Only ever joined through in queries; role_permissions rows go with the
+    # permission via ON DELETE CASCADE, so a delete need not load them.
     roles = relationship(
         "Role",
         secondary="role_permissions",
         back_populates="permissions",
-        lazy="dynamic"
+        lazy="raise",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -3,7 +3,8 @@ from __future__ import annotations
 """
 User Model
 """
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, FrozenSet
 from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -44,29 +45,50 @@ class User(BaseModel):
         back_populates="users",
         lazy="selectin"
     )
+    # Tokens are queried directly (AuthService); ON DELETE CASCADE removes
+    # them with the user without loading the collection.
     refresh_tokens = relationship(
         "RefreshToken",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="dynamic"
+        lazy="raise",
+        passive_deletes=True,
     )
 
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, username={self.username})>"
 
+    # Role and permission names are collected once per instance; a User
+    # loaded for a request lives only as long as that request, and route
+    # guards may check several names against it.
+    @cached_property
+    def role_names(self) -> FrozenSet[str]:
+        """Names of the user's roles"""
+        return frozenset(role.name for role in self.roles)
+
+    @cached_property
+    def permission_names(self) -> FrozenSet[str]:
+        """Permissions granted through the user's roles, by name and by resource:action"""
+        names = set()
+        for role in self.roles:
+            for perm in role.permissions:
+                names.add(perm.name)
+                names.add(perm.full_name)
+        return frozenset(names)
+
+    def reset_access_cache(self) -> None:
+        """Drop the cached role/permission names after the roles change"""
+        self.__dict__.pop("role_names", None)
+        self.__dict__.pop("permission_names", None)
+
     def has_role(self, role_name: str) -> bool:
         """Check if user has a specific role"""
-        return any(role.name == role_name for role in self.roles)
+        return role_name in self.role_names
 
     def has_permission(self, permission_name: str) -> bool:
         """
         Check if user has a specific permission
         Permission name can be in format 'resource:action' or just the permission name
         """
-        for role in self.roles:
-            for perm in role.permissions:
-                # Check by full name (resource:action) or just name
-                if perm.full_name == permission_name or perm.name == permission_name:
-                    return True
-        return False
+        return permission_name in self.permission_names
 
@@ -28,6 +28,10 @@ from .role import (
     RoleUpdate,
     RoleRead,
     RoleListItem,
+    ROLE_LIST_ADAPTER,
+    PERMISSION_SUMMARY_LIST_ADAPTER,
+    PERMISSION_LIST_ADAPTER,
+    SERVICE_LIST_ADAPTER,
 )
 
 __all__ = [
@@ -56,5 +60,9 @@ __all__ = [
     "RoleUpdate",
     "RoleRead",
     "RoleListItem",
+    "ROLE_LIST_ADAPTER",
+    "PERMISSION_SUMMARY_LIST_ADAPTER",
+    "PERMISSION_LIST_ADAPTER",
+    "SERVICE_LIST_ADAPTER",
 ]
 
@@ -1,11 +1,51 @@
 """
 Authentication schemas
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+import re
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter, field_validator
 from typing import Optional, List
 from datetime import datetime
 
 
+# Letters, digits, underscores and hyphens, with at least one letter or
+# digit. \w is Unicode-aware like str.isalnum(), so the accepted set is
+# unchanged.
+_USERNAME_RE = re.compile(r"[\w-]*[^\W_][\w-]*")
+
+
+def _validate_password_strength(password: str) -> str:
+    """Shared password policy for registration and password change"""
+    if len(password) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    # One pass over the password; str methods keep non-ASCII letters and
+    # digits counting, as before.
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        has_upper = has_upper or c.isupper()
+        has_lower = has_lower or c.islower()
+        has_digit = has_digit or c.isdigit()
+    if not has_upper:
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not has_lower:
+        raise ValueError('Password must contain at least one lowercase letter')
+    if not has_digit:
+        raise ValueError('Password must contain at least one digit')
+    return password
+
+
+def _normalize_role_names(roles: List[str]) -> List[str]:
+    """Strip role names, rejecting empty and duplicate names"""
+    sanitized = []
+    for role_name in roles:
+        role_name = role_name.strip()
+        if not role_name:
+            raise ValueError("Role name cannot be empty")
+        sanitized.append(role_name)
+    if len(set(sanitized)) != len(sanitized):
+        raise ValueError("Duplicate roles are not allowed")
+    return sanitized
+
+
 class UserRegister(BaseModel):
     """User registration schema"""
     email: EmailStr
@@ -15,23 +55,17 @@ class UserRegister(BaseModel):
     phone: Optional[str] = Field(None, max_length=20)
     department: Optional[str] = Field(None, max_length=100)
 
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        return _validate_password_strength(v)
 
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def validate_username(cls, v):
         """Validate username format"""
-        if not v.replace('_', '').replace('-', '').isalnum():
+        if not _USERNAME_RE.fullmatch(v):
             raise ValueError('Username must contain only alphanumeric characters, underscores, and hyphens')
         return v
 
@@ -77,8 +111,17 @@ class UserResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("roles", mode="before")
+    @classmethod
+    def _role_names(cls, value):
+        """Accept Role objects (e.g. ``User.roles``) as well as names"""
+        return [getattr(role, "name", role) for role in value]
+
+
+# Built once: validates ORM users and emits the JSON list in pydantic-core.
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
 
 
 class UserUpdate(BaseModel):
@@ -92,27 +135,19 @@ class UserRolesUpdate(BaseModel):
     """User roles update schema"""
     roles: List[str] = Field(..., description="List of role names to assign to the user")
 
-    @validator("roles", pre=True)
+    @field_validator("roles", mode="before")
+    @classmethod
     def validate_roles_provided(cls, value):
         """Ensure the roles field is provided"""
         if value is None:
             raise ValueError("Roles list is required")
         return value
 
-    @validator("roles", each_item=True)
-    def validate_role_name(cls, role_name: str) -> str:
-        """Ensure each role name is non-empty"""
-        sanitized = role_name.strip()
-        if not sanitized:
-            raise ValueError("Role name cannot be empty")
-        return sanitized
-
-    @validator("roles")
-    def validate_unique_roles(cls, roles: List[str]) -> List[str]:
-        """Ensure role names are unique"""
-        if len(set(roles)) != len(roles):
-            raise ValueError("Duplicate roles are not allowed")
-        return roles
+    @field_validator("roles")
+    @classmethod
+    def validate_role_names(cls, roles: List[str]) -> List[str]:
+        """Ensure role names are non-empty and unique"""
+        return _normalize_role_names(roles)
 
 
 class AdminUserUpdate(BaseModel):
@@ -125,20 +160,11 @@ class AdminUserUpdate(BaseModel):
     is_verified: Optional[bool] = None
     roles: Optional[List[str]] = Field(None, description="List of role names to assign to the user")
 
-    @validator("roles", each_item=True)
-    def validate_role_name(cls, role_name: str) -> str:
-        """Ensure each role name is non-empty"""
-        sanitized = role_name.strip()
-        if not sanitized:
-            raise ValueError("Role name cannot be empty")
-        return sanitized
-
-    @validator("roles")
-    def validate_unique_roles(cls, roles: Optional[List[str]]) -> Optional[List[str]]:
-        """Ensure role names are unique"""
-        if roles is not None and len(set(roles)) != len(roles):
-            raise ValueError("Duplicate roles are not allowed")
-        return roles
+    @field_validator("roles")
+    @classmethod
+    def validate_role_names(cls, roles: Optional[List[str]]) -> Optional[List[str]]:
+        """Ensure role names are non-empty and unique"""
+        return None if roles is None else _normalize_role_names(roles)
 
 
 class PasswordChange(BaseModel):
@@ -146,16 +172,9 @@ class PasswordChange(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8, max_length=100)
 
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password(cls, v):
         """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        return _validate_password_strength(v)
 
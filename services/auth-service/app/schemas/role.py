@@ -6,7 +6,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class PermissionBase(BaseModel):
@@ -141,3 +141,8 @@ class RoleListItem(RoleBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Built once: validate and serialize whole listings in pydantic-core.
+ROLE_LIST_ADAPTER = TypeAdapter(List[RoleListItem])
+PERMISSION_SUMMARY_LIST_ADAPTER = TypeAdapter(List[PermissionSummary])
+PERMISSION_LIST_ADAPTER = TypeAdapter(List[PermissionRead])
+SERVICE_LIST_ADAPTER = TypeAdapter(List[ServiceRead])
@@ -4,8 +4,10 @@ Authentication service
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
+from app.models.role import Role
 from app.models.user import User
+from app.models.user_role import UserRole
 from app.models.refresh_token import RefreshToken
 from app.schemas.auth import UserRegister, UserLogin, TokenResponse
 from app.utils.security import (
@@ -75,6 +77,18 @@ class AuthService:
 
         return user
     
+    def get_role_names(self, user_id: int) -> List[str]:
+        """
+        Names of the user's roles, read straight from the join table
+        """
+        rows = (
+            self.db.query(Role.name)
+            .join(UserRole, UserRole.role_id == Role.id)
+            .filter(UserRole.user_id == user_id)
+            .all()
+        )
+        return [name for (name,) in rows]
+    
     def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """
         Authenticate user with username and password
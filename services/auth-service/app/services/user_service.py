@@ -1,7 +1,8 @@
 """
 User service for user management
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, lazyload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
 from datetime import datetime
 from typing import Optional, List
@@ -13,6 +14,16 @@ from services.shared.audit import record_event
 from app.utils.security import verify_password, get_password_hash
 
 
+# Role's own relationships are all lazy="selectin"; user endpoints only report
+# role names, so skip loading each role's users, permissions and services.
+_ROLE_NAME_ONLY = (
+    lazyload(Role.users),
+    lazyload(Role.permissions),
+    lazyload(Role.services),
+    lazyload(Role.service_access_links),
+)
+
+
 class UserService:
     """User service for managing user accounts"""
     
@@ -21,7 +32,7 @@ class UserService:
     
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.get(User, user_id)
     
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
@@ -91,6 +102,7 @@ class UserService:
         if unique_role_names:
             roles = (
                 self.db.query(Role)
+                .options(*_ROLE_NAME_ONLY)
                 .filter(Role.name.in_(unique_role_names), Role.is_active == True)
                 .all()
             )
@@ -118,8 +130,11 @@ class UserService:
 
         self.db.commit()
 
-        # Reload user with roles
-        updated_user = self.get_user_with_roles(user.id)
+        # The committed assignments are exactly `roles`; install them as the
+        # loaded collection instead of re-querying the user and its roles.
+        set_committed_value(user, "roles", roles)
+        user.reset_access_cache()
+        updated_user = user
 
         record_event(
             action="user.roles.update",
@@ -155,7 +170,8 @@ class UserService:
             updated_fields["is_verified"] = user_data.is_verified
 
         self.db.commit()
-        self.db.refresh(user)
+        # Only updated_at changes server-side; the other fields were set above.
+        self.db.refresh(user, attribute_names=["updated_at"])
         
         # Update roles if provided
         if user_data.roles is not None:
@@ -175,17 +191,22 @@ class UserService:
 
     def get_user_with_roles(self, user_id: int) -> Optional[User]:
         """Get user with roles loaded"""
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if user:
-            # Trigger loading of roles
-            _ = user.roles
-        return user
+        return (
+            self.db.query(User)
+            .options(selectinload(User.roles).options(*_ROLE_NAME_ONLY))
+            .filter(User.id == user_id)
+            .first()
+        )
 
     def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get all users with their roles"""
-        users = self.db.query(User).offset(skip).limit(limit).all()
-        # Trigger loading of roles for all users
-        for user in users:
-            _ = user.roles
-        return users
+        # One IN query for the page's roles, without each role in turn
+        # loading all of its users and permissions.
+        return (
+            self.db.query(User)
+            .options(selectinload(User.roles).options(*_ROLE_NAME_ONLY))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
@@ -0,0 +1,23 @@
+"""
+ETag helpers for conditional GET responses
+"""
+import hashlib
+from typing import Iterable, Optional, Union
+
+
+def compute_etag(parts: Iterable[Union[str, bytes]]) -> str:
+    """Strong ETag over the given representation parts"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches ``etag``"""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match.
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
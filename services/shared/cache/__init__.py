@@ -0,0 +1,7 @@
+"""
+In-process caches shared by the services.
+"""
+from .invalidation import invalidate_after_commit
+from .ttl import TTLCache
+
+__all__ = ["TTLCache", "invalidate_after_commit"]
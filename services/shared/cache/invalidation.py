@@ -0,0 +1,43 @@
+"""
+Commit-time invalidation of in-process caches.
+"""
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+
+def invalidate_after_commit(models: Iterable[type], invalidate: Callable[[], None]) -> None:
+    """
+    Call ``invalidate`` once a session that wrote any of ``models`` commits.
+
+    Writes are ORM flushes or UPDATE/DELETE statements executed through the
+    session. Invalidating at commit rather than at write time means a
+    concurrent reader cannot re-cache the old rows before the commit lands;
+    a rollback drops the pending invalidation.
+    """
+    models = tuple(models)
+    mappers = tuple(model.__mapper__ for model in models)
+    # Unique per registration, so several caches can watch the same session.
+    changed = object()
+
+    @event.listens_for(Session, "after_flush")
+    def _flag_flushed_rows(session: Session, flush_context: Any) -> None:
+        for instance in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(instance, models):
+                session.info[changed] = True
+                return
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _flag_statements(state: ORMExecuteState) -> None:
+        if (state.is_update or state.is_delete) and state.bind_mapper in mappers:
+            state.session.info[changed] = True
+
+    @event.listens_for(Session, "after_commit")
+    def _invalidate(session: Session) -> None:
+        if session.info.pop(changed, False):
+            invalidate()
+
+    @event.listens_for(Session, "after_rollback")
+    def _discard_flag(session: Session) -> None:
+        session.info.pop(changed, None)
@@ -13,6 +13,9 @@ class Settings(BaseSettings):
     APP_NAME: str = "Traffic System Backend"
     APP_ENV: str = os.getenv("APP_ENV", "development")
     DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
+    # Serve the built frontend (and its SPA fallback) from the auth service.
+    # Turn off when a reverse proxy serves the build with try_files.
+    SERVE_FRONTEND: bool = os.getenv("SERVE_FRONTEND", "True").lower() == "true"
     API_V1_PREFIX: str = "/api/v1"
     
     # Database
@@ -42,6 +45,24 @@ class Settings(BaseSettings):
         "http://localhost:8080",
         "http://localhost:5173",
     ]
+    # Explicit lists let CORSMiddleware build its preflight headers once,
+    # rather than echoing each request's Access-Control-Request-Headers.
+    CORS_ALLOW_METHODS: List[str] = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+    CORS_ALLOW_HEADERS: List[str] = [
+        "authorization",
+        "content-type",
+        "if-none-match",
+        "x-correlation-id",
+        "x-request-id",
+        "traceparent",
+        "x-tenant-id",
+        "x-session-id",
+        "x-forwarded-for",
+    ]
+    # Response headers cross-origin scripts may read (the /events cursor).
+    CORS_EXPOSE_HEADERS: List[str] = ["X-Next-After-Time", "X-Next-After-Id"]
+    # Seconds browsers may reuse a preflight response.
+    CORS_MAX_AGE: int = int(os.getenv("CORS_MAX_AGE", "86400"))
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -0,0 +1,45 @@
+"""
+Alembic helpers for schema changes on large, write-heavy tables
+"""
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def create_index_online(
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    unique: bool = False,
+) -> None:
+    """
+    Build an index without blocking concurrent writes.
+
+    On MySQL the index is added with ``ALGORITHM=INPLACE, LOCK=NONE`` so that
+    inserts keep flowing during the build (the statement fails fast instead
+    of silently taking a table lock if online DDL is not possible). Other
+    dialects fall back to a plain ``op.create_index``.
+
+    Columns are raw SQL fragments, e.g. ``"event_time DESC"``.
+    """
+    if op.get_context().dialect.name != "mysql":
+        op.create_index(name, table, [sa.text(column) for column in columns], unique=unique)
+        return
+
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    op.execute(
+        f"ALTER TABLE {table} ADD {kind} {name} ({', '.join(columns)}), "
+        "ALGORITHM=INPLACE, LOCK=NONE"
+    )
+
+
+def drop_index_online(name: str, table: str) -> None:
+    """
+    Drop an index without blocking concurrent writes (see ``create_index_online``).
+    """
+    if op.get_context().dialect.name != "mysql":
+        op.drop_index(name, table_name=table)
+        return
+
+    op.execute(f"ALTER TABLE {table} DROP INDEX {name}, ALGORITHM=INPLACE, LOCK=NONE")
@@ -15,6 +15,10 @@ DB_USER = os.getenv("DB_USER", "root")
 DB_PASS = os.getenv("DB_PASS", "")
 DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
 DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+# Compiled-statement cache entries per engine (SQLAlchemy's default is 500),
+# sized so each statement shape -- including every loader-option set and
+# IN-list arity -- keeps its compiled SQL instead of being evicted.
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
 
 # Synchronous database URL
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
@@ -28,6 +32,7 @@ engine = create_engine(
     pool_size=DB_POOL_SIZE,
     max_overflow=DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
     echo=os.getenv("DEBUG", "False").lower() == "true"
 )
 
@@ -37,11 +42,16 @@ async_engine = create_async_engine(
     pool_size=DB_POOL_SIZE,
     max_overflow=DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
     echo=os.getenv("DEBUG", "False").lower() == "true"
 )
 
 # Session makers
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay loaded after commit, as with the async sessions; code that
+# needs server-side values back calls refresh() for just those columns.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+)
 AsyncSessionLocal = async_sessionmaker(
     async_engine,
     class_=AsyncSession,
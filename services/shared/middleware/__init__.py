@@ -1,7 +1,8 @@
 """
 Shared middleware components for backend services.
 """
+from .health import HealthCheckMiddleware
 from .request_logging import RequestLoggingMiddleware, configure_request_logging
 
-__all__ = ["RequestLoggingMiddleware", "configure_request_logging"]
+__all__ = ["HealthCheckMiddleware", "RequestLoggingMiddleware", "configure_request_logging"]
 
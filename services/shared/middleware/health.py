@@ -0,0 +1,39 @@
+"""
+Health check short-circuit for FastAPI services.
+"""
+from __future__ import annotations
+
+import json
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class HealthCheckMiddleware:
+    """
+    Answer ``GET``/``HEAD`` health probes before any other middleware runs.
+
+    Registered last, so it is the outermost user middleware: probes skip
+    CORS, request logging and routing. Other methods fall through to the app.
+    """
+
+    def __init__(self, app: ASGIApp, *, service_name: str, path: str = "/health") -> None:
+        self.app = app
+        self.path = path
+        self.body = json.dumps({"status": "healthy", "service": service_name}).encode()
+        self.headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self.body)).encode()),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] != self.path
+            or scope["method"] not in ("GET", "HEAD")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        body = b"" if scope["method"] == "HEAD" else self.body
+        await send({"type": "http.response.body", "body": body})